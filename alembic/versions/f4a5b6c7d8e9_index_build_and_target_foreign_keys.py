@@ -0,0 +1,26 @@
+"""index build and target foreign keys
+
+Revision ID: f4a5b6c7d8e9
+Revises: e3f4a5b6c7d8
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "f4a5b6c7d8e9"
+down_revision: Union[str, None] = "e3f4a5b6c7d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_builds_build_target_id", "builds", ["build_target_id"])
+    op.create_index("ix_build_targets_project_id", "build_targets", ["project_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_build_targets_project_id", table_name="build_targets")
+    op.drop_index("ix_builds_build_target_id", table_name="builds")
@@ -42,6 +42,7 @@ class BuildBridgeWindow(QMainWindow):
         self.build_list_widget = None
         self.build_target_widget = None
         self.project_combo = None
+        self._project_rows: dict[int, int] = {}
         self.init_ui()
 
     def init_ui(self):
@@ -134,9 +135,15 @@ class BuildBridgeWindow(QMainWindow):
 
         self.project_combo.blockSignals(True)
         self.project_combo.clear()
+        self._project_rows = {}
 
         with SessionFactory() as session:
-            projects = session.query(Project).order_by(Project.name.asc(), Project.id.asc()).all()
+            # The combo only needs labels and ids; skip hydrating full Project rows.
+            projects = (
+                session.query(Project.id, Project.name)
+                .order_by(Project.name.asc(), Project.id.asc())
+                .all()
+            )
 
         if not projects:
             self.project_combo.addItem("No projects configured", None)
@@ -145,13 +152,14 @@ class BuildBridgeWindow(QMainWindow):
             return
 
         self.project_combo.setEnabled(True)
-        for project in projects:
+        for row, project in enumerate(projects):
             label = project.name or f"Project {project.id}"
             self.project_combo.addItem(label, project.id)
+            self._project_rows[project.id] = row
 
         if self.project:
-            index = self.project_combo.findData(self.project.id)
-            if index >= 0:
+            index = self._project_rows.get(self.project.id)
+            if index is not None:
                 self.project_combo.setCurrentIndex(index)
 
         self.project_combo.blockSignals(False)
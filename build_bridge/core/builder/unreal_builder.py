@@ -6,6 +6,9 @@ from typing import List, Optional
 from build_bridge.models import BuildTargetPlatformEnum, BuildTypeEnum
 
 
+# Parsed .uproject contents keyed by path, stored with the mtime they were read at.
+_UPROJECT_CACHE: dict[str, tuple[int, dict]] = {}
+
 
 class BuildAlreadyExistsError(Exception):
     """Raised when a build with the same name/version exists."""
@@ -55,7 +58,13 @@ class UnrealBuilder:
         clean: bool = False,
         valve_package_pad: bool = False,
         allow_existing_output_dir: bool = False,
+        *,
+        uproject_path: Optional[str] = None,
     ):
+        """
+        Pass ``uproject_path`` when the caller already knows the project file to
+        skip searching ``source_dir`` for it.
+        """
 
         self.source_dir = source_dir
         self.engine_path = engine_path
@@ -73,13 +82,20 @@ class UnrealBuilder:
         self.output_dir = output_dir
         
         # Project path validation
-        self.uproj_path = self.get_uproject_path()
-        
+        if uproject_path and os.path.isfile(uproject_path):
+            self.uproj_path = os.path.normpath(uproject_path)
+        else:
+            self.uproj_path = self.get_uproject_path()
 
         # Determine engine version and validate
         self.target_ue_version = self.get_engine_version_from_uproj()
         self.check_unreal_engine_installed()
 
+        self.uat_script = os.path.join(
+            self.engine_path,
+            "Engine/Build/BatchFiles/RunUAT.bat" if sys.platform == "win32" else "Engine/Build/BatchFiles/RunUAT.sh"
+        )
+
     def get_uproject_path(self, recurse_level: int = 1) -> str:
         """
         Finds the .uproject file in the source directory or its subdirectories.
@@ -124,19 +140,27 @@ class UnrealBuilder:
             ProjectFileNotFoundError: If the project file does not exist.
             EngineVersionError: If the engine version cannot be read or is missing.
         """
-        if not os.path.exists(self.uproj_path):
+        try:
+            mtime = os.stat(self.uproj_path).st_mtime_ns
+        except OSError:
             raise ProjectFileNotFoundError(
                 f"Project file not found: {self.uproj_path}"
             )
         try:
-            with open(self.uproj_path, "r") as f:
-                uproject_data = json.load(f)
-                engine_version = uproject_data.get("EngineAssociation")
-                if not engine_version:
-                    raise EngineVersionError(
-                        "Engine version not specified in .uproject file."
-                    )
-                return engine_version
+            cached = _UPROJECT_CACHE.get(self.uproj_path)
+            if cached and cached[0] == mtime:
+                uproject_data = cached[1]
+            else:
+                with open(self.uproj_path, "r") as f:
+                    uproject_data = json.load(f)
+                _UPROJECT_CACHE[self.uproj_path] = (mtime, uproject_data)
+
+            engine_version = uproject_data.get("EngineAssociation")
+            if not engine_version:
+                raise EngineVersionError(
+                    "Engine version not specified in .uproject file."
+                )
+            return engine_version
         except Exception as e:
             raise EngineVersionError(f"Failed to read .uproject file: {str(e)}")
 
@@ -160,10 +184,7 @@ class UnrealBuilder:
 
     def get_build_command(self):
         """Returns the UAT command as a list for QProcess using config settings."""
-        uat_script = os.path.join(
-            self.engine_path,
-            "Engine/Build/BatchFiles/RunUAT.bat" if sys.platform == "win32" else "Engine/Build/BatchFiles/RunUAT.sh"
-        )
+        uat_script = self.uat_script
 
         if not os.path.exists(uat_script):
             raise UATScriptNotFoundError(f"UAT script not found at {uat_script}")
@@ -1,3 +1,4 @@
+import os
 import shutil
 from pathlib import Path
 
@@ -63,6 +64,47 @@ def prepare_build_output_directory(output_path: str, overwrite: bool = False):
         _clear_build_directory_contents(build_path)
 
 
+def scan_build_folders(scan_root: str, skip_names=()) -> list[tuple[str, str, float]]:
+    """Return ``(name, path, mtime)`` for each build folder directly under ``scan_root``.
+
+    Only touches the filesystem, so it is safe to run off the GUI thread. A missing
+    ``scan_root`` raises ``FileNotFoundError`` from the scan itself rather than
+    costing a separate existence check.
+    """
+    skip_names = set(skip_names)
+    folders = []
+    with os.scandir(scan_root) as entries:
+        for entry in entries:
+            if entry.name in skip_names or not entry.is_dir():
+                continue
+            folders.append((entry.name, entry.path, entry.stat().st_mtime))
+    folders.sort()
+    return folders
+
+
+def has_windows_executable(build_root: str) -> bool:
+    """Return True if ``build_root`` or its first subfolder contains a ``.exe``.
+
+    Raises ``OSError`` if ``build_root`` cannot be listed.
+    """
+    first_subfolder = None
+    with os.scandir(build_root) as entries:
+        for entry in entries:
+            if entry.is_file():
+                if entry.name.lower().endswith(".exe"):
+                    return True
+            elif first_subfolder is None and entry.is_dir():
+                first_subfolder = entry.path
+
+    if not first_subfolder:
+        return False
+
+    with os.scandir(first_subfolder) as entries:
+        return any(
+            entry.name.lower().endswith(".exe") and entry.is_file() for entry in entries
+        )
+
+
 def _clear_build_directory_contents(build_path: Path):
     if not build_path.is_dir():
         raise UnsafeBuildPathError(f"Build output path is not a directory: {build_path}")
@@ -71,11 +113,14 @@ def _clear_build_directory_contents(build_path: Path):
         raise UnsafeBuildPathError(f"Refusing to clear unsafe path: {build_path}")
 
     try:
-        for child in build_path.iterdir():
-            if child.is_dir() and not child.is_symlink():
-                shutil.rmtree(child)
-            else:
-                child.unlink()
+        # DirEntry carries the file type from the directory listing, so this
+        # costs no extra stat per child; rmtree handles each subtree natively.
+        with os.scandir(build_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
     except OSError as exc:
         raise BuildDeletionError(f"Failed to clear build output path: {exc}") from exc
 
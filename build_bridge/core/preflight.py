@@ -5,12 +5,14 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
+from build_bridge.core.builds import has_windows_executable
 from build_bridge.core.publisher.itch.itch_publisher import (
     validate_itch_channel,
     validate_itch_target,
 )
 from build_bridge.exceptions import InvalidConfigurationError
 from build_bridge.models import StoreEnum
+from build_bridge.utils.paths import existing_paths
 
 
 @dataclass
@@ -24,6 +26,8 @@ class PreflightIssue:
 class PreflightResult:
     title: str
     issues: list[PreflightIssue] = field(default_factory=list)
+    # Set by build preflight so the builder can reuse it instead of searching again.
+    uproject_path: str | None = None
 
     @property
     def has_blockers(self) -> bool:
@@ -75,28 +79,7 @@ def _has_windows_executable(build_root: str) -> bool:
         return False
 
     try:
-        if any(
-            filename.lower().endswith(".exe")
-            for filename in os.listdir(build_root)
-            if os.path.isfile(os.path.join(build_root, filename))
-        ):
-            return True
-
-        first_subfolder = None
-        for item in os.listdir(build_root):
-            full_path = os.path.join(build_root, item)
-            if os.path.isdir(full_path):
-                first_subfolder = full_path
-                break
-
-        if not first_subfolder:
-            return False
-
-        return any(
-            filename.lower().endswith(".exe")
-            for filename in os.listdir(first_subfolder)
-            if os.path.isfile(os.path.join(first_subfolder, filename))
-        )
+        return has_windows_executable(build_root)
     except OSError:
         return False
 
@@ -140,6 +123,7 @@ def validate_build_preflight(build_target, release_name: str) -> PreflightResult
     _check_directory(result, "Project source", source_dir)
 
     uproject_path = _find_uproject(source_dir)
+    result.uproject_path = uproject_path
     if uproject_path:
         result.ok(".uproject file", uproject_path)
     else:
@@ -358,8 +342,9 @@ def _validate_depots(result: PreflightResult, depots: Iterable | dict | None):
         result.error("Steam depots", "Depot mappings are not stored in a valid format.")
         return
 
+    present = existing_paths(str(path) for path in depots.values() if _truthy(path))
     for depot_id, depot_path in depots.items():
-        if _truthy(depot_id) and _truthy(depot_path) and os.path.exists(str(depot_path)):
+        if _truthy(depot_id) and _truthy(depot_path) and str(depot_path) in present:
             result.ok(f"Steam depot {depot_id}", str(depot_path))
         elif _truthy(depot_id) and _truthy(depot_path):
             result.error(f"Steam depot {depot_id}", f"Path not found: {depot_path}")
@@ -14,5 +14,5 @@ class BasePublisher(ABC):
 
 
     @abstractmethod
-    def publish(self, content_dir: str, version: str = ""):
+    def publish(self, content_dir: str, version: str = "", parent=None):
         """Execute the publishing process."""
@@ -8,12 +8,26 @@ from build_bridge.core.publisher.base_publisher import BasePublisher
 from build_bridge.exceptions import InvalidConfigurationError
 from build_bridge.models import PublishProfile
 from build_bridge.views.dialogs.publish_dialog import GenericUploadDialog
-from PyQt6.QtWidgets import QDialog
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QDialog, QWidget
 
 ITCH_TARGET_PATTERN = re.compile(r"^[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+$")
 ITCH_CHANNEL_PATTERN = re.compile(r"^[a-zA-Z0-9_.-]+$")
 
 
+ITCH_SUCCESS_INDICATORS = ["build is processed", "patch applied", "tasks ended."]
+ITCH_ERROR_INDICATORS = ["error:", "failed", "panic:", "invalid api key", "denied"]
+
+# One case-insensitive alternation per list scans the log in a single pass
+# without building a lowercased copy of it.
+_ITCH_SUCCESS_RE = re.compile(
+    "|".join(re.escape(ind) for ind in ITCH_SUCCESS_INDICATORS), re.IGNORECASE
+)
+_ITCH_ERROR_RE = re.compile(
+    "|".join(re.escape(ind) for ind in ITCH_ERROR_INDICATORS), re.IGNORECASE
+)
+
+
 def check_itch_success(exit_code: int, log_content: str) -> bool:
     """
     Checks butler output for success indicators.
@@ -25,14 +39,10 @@ def check_itch_success(exit_code: int, log_content: str) -> bool:
     Returns:
         True if the upload seems successful, False otherwise.
     """
-    log_lower = log_content.lower()
-    success_indicators = ["build is processed", "patch applied", "tasks ended."]
-    error_indicators = ["error:", "failed", "panic:", "invalid api key", "denied"]
-
     is_success = (
         exit_code == 0
-        and any(ind in log_lower for ind in success_indicators)
-        and not any(err in log_lower for err in error_indicators)
+        and _ITCH_SUCCESS_RE.search(log_content) is not None
+        and _ITCH_ERROR_RE.search(log_content) is None
     )
 
     return is_success
@@ -99,13 +109,14 @@ class ItchPublisher(BasePublisher):
                 "Butler not found. Please set it in Settings."
             )
 
-    def publish(self, content_dir: str, version: str = ""):
+    def publish(self, content_dir: str, version: str = "", parent: QWidget | None = None):
         """
         Prepares the butler command and launches the ItchUploadDialog to execute it.
 
         Args:
             content_dir: Path to the directory containing the built game files.
             version: The version string for this build (e.g., "1.0.0").
+            parent: Optional widget the upload dialog is parented to.
         """
         logging.info(f"Preparing Itch.io publish for build: {version}")
 
@@ -141,7 +152,12 @@ class ItchPublisher(BasePublisher):
                     "content_dir": content_dir,
                 },
                 success_checker=check_itch_success,
+                parent=parent,
             )
+            # Parented to the main window, so it must delete itself on close or
+            # every finished upload (log and QProcess) stays alive.
+            dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+            dialog.finished.connect(dialog.cleanup)
             # The dialog will handle QProcess execution and feedback
             result = dialog.exec()
 
@@ -1,14 +1,32 @@
 import os, logging
+from pathlib import Path
+from typing import ClassVar
+
 from jinja2 import Template
 
-from build_bridge.models import SteamPublishProfile
+from build_bridge.core.publisher.steam.steam_publish_snapshot import (
+    SteamPublishSnapshot,
+)
 
 
 class SteamPipeConfigurator:
     TEMPLATE_FILE = os.path.join(os.path.dirname(__file__), "app_build_template.vdf")
 
-    def __init__(self, publish_profile: SteamPublishProfile):
-        self.publish_profile = publish_profile
+    # The template ships with the app, so it is read and compiled once per process.
+    _template: ClassVar[Template | None] = None
+
+    def __init__(self, snapshot: SteamPublishSnapshot):
+        self.snapshot = snapshot
+
+    @classmethod
+    def _get_template(cls) -> Template:
+        if cls._template is None:
+            try:
+                source = Path(cls.TEMPLATE_FILE).read_text(encoding="utf-8")
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Template file not found: {cls.TEMPLATE_FILE}")
+            cls._template = Template(source)
+        return cls._template
 
     def create_or_update_vdf_file(self, content_root: str):
         """
@@ -19,14 +37,13 @@ class SteamPipeConfigurator:
         Args:
             content_root (str): The content root directory of the build to publish.
         """
-        if not os.path.exists(self.TEMPLATE_FILE):
-            raise FileNotFoundError(f"Template file not found: {self.TEMPLATE_FILE}")
-        
-        builder_path = self.publish_profile.builder_path
+        template = self._get_template()
 
-        app_id = self.publish_profile.app_id
-        description = self.publish_profile.description or "Build Bridge upload"
-        depot_mappings = self.publish_profile.depots
+        snapshot = self.snapshot
+        builder_path = snapshot.builder_path
+        app_id = snapshot.app_id
+        description = snapshot.description or "Build Bridge upload"
+        depot_mappings = snapshot.depots
 
         # Create necessary directories and files if don't exist
         # <UserDefinedPath>
@@ -35,7 +52,7 @@ class SteamPipeConfigurator:
         #       \_ app_build.vdf
         #       \_ ...
          
-        os.makedirs(builder_path, exist_ok=True)
+        # BuildLogs lives inside builder_path, so one makedirs creates both.
         log_dir = os.path.join(builder_path, "BuildLogs")
         os.makedirs(log_dir, exist_ok=True)
 
@@ -43,32 +60,39 @@ class SteamPipeConfigurator:
         content_root_rel = os.path.relpath(content_root, builder_path)
         log_dir_rel = os.path.relpath(log_dir, builder_path)
 
-        # Read and render the template using Jinja2
-        with open(self.TEMPLATE_FILE, "r", encoding="utf-8") as template_file:
-            template_content = template_file.read()
-            template = Template(template_content)
-            vdf_content = template.render(
-                app_id=app_id,
-                description=description,
-                content_root=content_root_rel,
-                build_output=log_dir_rel,
-                depot_mappings=depot_mappings,
-            )
+        vdf_content = template.render(
+            app_id=app_id,
+            description=description,
+            content_root=content_root_rel,
+            build_output=log_dir_rel,
+            depot_mappings=depot_mappings,
+        )
 
         # Write the rendered VDF content to the builder directory
         app_build_vdf_path = os.path.join(builder_path, "app_build.vdf")
+        # Same bytes a text-mode write would produce on this platform.
+        new_bytes = vdf_content.replace("\n", os.linesep).encode("utf-8")
 
-        vdf_created = False # created? or updated?
+        try:
+            with open(app_build_vdf_path, "rb") as vdf_file:
+                existing_bytes = vdf_file.read()
+        except FileNotFoundError:
+            existing_bytes = None
 
-        if not os.path.exists(app_build_vdf_path):
-            vdf_created = True
+        if existing_bytes == new_bytes:
+            logging.info(f"VDF file unchanged at: {app_build_vdf_path}")
+            return app_build_vdf_path
 
-        with open(app_build_vdf_path, "w", encoding="utf-8") as vdf_file:
-            vdf_file.write(vdf_content)
+        # Write next to the target and swap it in so steamcmd never sees a
+        # half-written file.
+        tmp_path = f"{app_build_vdf_path}.tmp"
+        with open(tmp_path, "wb") as vdf_file:
+            vdf_file.write(new_bytes)
+        os.replace(tmp_path, app_build_vdf_path)
 
-        if vdf_created:
+        if existing_bytes is None:
             logging.info(f"VDF file generated at: {app_build_vdf_path}")
         else:
             logging.info(f"Existing VDF file updated at: {app_build_vdf_path}")
-            
+
         return app_build_vdf_path
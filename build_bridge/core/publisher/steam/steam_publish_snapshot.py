@@ -0,0 +1,37 @@
+from dataclasses import dataclass, field
+
+from build_bridge.models import SteamPublishProfile
+
+
+@dataclass(frozen=True)
+class SteamPublishSnapshot:
+    """Plain copy of everything a Steam upload reads from the database.
+
+    Built once when publishing starts, so the VDF configurator and the upload
+    dialog never trigger lazy loads while steamcmd is running.
+    """
+
+    app_id: int
+    description: str | None
+    builder_path: str
+    steamcmd_path: str
+    username: str
+    # Kept out of repr so logging or printing a snapshot never shows it.
+    password: str = field(default="", repr=False)
+    project_name: str = ""
+    depots: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_profile(cls, profile: SteamPublishProfile) -> "SteamPublishSnapshot":
+        steam_config = profile.steam_config
+        project = profile.project
+        return cls(
+            app_id=profile.app_id,
+            description=profile.description,
+            builder_path=profile.builder_path,
+            steamcmd_path=steam_config.steamcmd_path,
+            username=steam_config.username,
+            password=steam_config.password or "",
+            project_name=project.name if project else "",
+            depots=dict(profile.depots or {}),
+        )
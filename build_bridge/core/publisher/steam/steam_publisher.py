@@ -1,4 +1,9 @@
+import re
 from pathlib import Path
+from typing import Optional
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QWidget
 
 from build_bridge.models import SteamPublishProfile
 from build_bridge.exceptions import InvalidConfigurationError
@@ -6,8 +11,22 @@ from build_bridge.core.publisher.base_publisher import BasePublisher
 from build_bridge.core.publisher.steam.steam_pipe_configurator import (
     SteamPipeConfigurator,
 )
+from build_bridge.core.publisher.steam.steam_publish_snapshot import (
+    SteamPublishSnapshot,
+)
 from build_bridge.views.dialogs.publish_dialog import GenericUploadDialog
 
+# One case-insensitive pass over the log finds every token the check cares
+# about, instead of lowercasing a copy and scanning it once per phrase.
+# Mentions of steamcmd's stderr log are not treated as errors.
+_STEAM_LOG_TOKENS_RE = re.compile(
+    r"(?P<login>to steam public\.\.\.ok)"
+    r"|(?P<build>app build successful|successfully finished)"
+    r"|(?P<error>(?<!std)error|failed)",
+    re.IGNORECASE,
+)
+
+
 def check_steam_success(exit_code: int, log_content: str) -> bool:
     """
     Checks steamcmd output for success indicators.
@@ -19,24 +38,20 @@ def check_steam_success(exit_code: int, log_content: str) -> bool:
     Returns:
         True if the upload seems successful, False otherwise.
     """
-    log_lower = log_content.lower()
+    if exit_code != 0:
+        return False
 
-    # Check for successful login
-    login_ok = "to steam public...ok" in log_lower
+    login_ok = build_success = False
+    for match in _STEAM_LOG_TOKENS_RE.finditer(log_content):
+        kind = match.lastgroup
+        if kind == "error":
+            return False
+        if kind == "login":
+            login_ok = True
+        else:
+            build_success = True
 
-    # Check for successful build
-    build_success = (
-        "app build successful" in log_lower or 
-        "successfully finished" in log_lower
-    )
-
-    # Check for absence of actual errors (exclude benign cases like 'stderr')
-    no_errors = not (
-        "error" in log_lower.replace("stderr", "") or 
-        "failed" in log_lower
-    )
-
-    return exit_code == 0 and login_ok and build_success and no_errors
+    return login_ok and build_success
 
 
 class SteamPublisher(BasePublisher):
@@ -59,23 +74,33 @@ class SteamPublisher(BasePublisher):
         if not steam_config.steamcmd_path:
             raise InvalidConfigurationError("SteamCMD not set in Steam Settings.")
 
-    def publish(self, content_dir: str, version: str = ""):
-        """Start the Steam publishing process."""
+    def publish(
+        self, content_dir: str, version: str = "", parent: Optional[QWidget] = None
+    ) -> GenericUploadDialog:
+        """Start the Steam publishing process.
+
+        The upload dialog is shown non-modally so the rest of the app stays usable
+        while steamcmd runs. Pass a parent so Qt keeps the dialog alive after this
+        returns; connect to the returned dialog's ``finished`` signal to react
+        when the upload ends.
+        """
 
         self.validate_publish_profile()
 
-        configurator = SteamPipeConfigurator(publish_profile=self.publish_profile)
+        snapshot = SteamPublishSnapshot.from_profile(self.publish_profile)
+
+        configurator = SteamPipeConfigurator(snapshot)
 
         vdf_path = configurator.create_or_update_vdf_file(content_root=content_dir)
 
         # Generate or update the VDF file.
-        executable = self.publish_profile.steam_config.steamcmd_path
+        executable = snapshot.steamcmd_path
         steamcmd_dir = Path(executable).parent
-        builder_log_dir = Path(self.publish_profile.builder_path) / "BuildLogs"
+        builder_log_dir = Path(snapshot.builder_path) / "BuildLogs"
         arguments = [
             "+login",
-            self.publish_profile.steam_config.username,
-            self.publish_profile.steam_config.password or "",  # Include password if set
+            snapshot.username,
+            snapshot.password,  # Include password if set
             "+run_app_build",
             vdf_path,
             "+quit",
@@ -84,11 +109,10 @@ class SteamPublisher(BasePublisher):
         # --- Prepare Display Info & Title ---
         display_info = {
             "Build ID": version,
-            "App ID": str(self.publish_profile.app_id),
-            "Target": f"Steam ({self.publish_profile.steam_config.username})",
+            "App ID": str(snapshot.app_id),
+            "Target": f"Steam ({snapshot.username})",
         }
-        project_name = self.publish_profile.project.name if self.publish_profile.project else ""
-        title = f"Steam Upload: {project_name} - {version}"
+        title = f"Steam Upload: {snapshot.project_name} - {version}"
 
         # Proceed with publishing
         dialog = GenericUploadDialog(
@@ -103,8 +127,10 @@ class SteamPublisher(BasePublisher):
             ],
             log_directories=[str(builder_log_dir)],
             working_directory=str(steamcmd_dir),
+            parent=parent,
         )
-        dialog.exec()
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.finished.connect(dialog.cleanup)
+        dialog.show()
 
-        # Clean up the upload process
-        dialog.cleanup()
+        return dialog
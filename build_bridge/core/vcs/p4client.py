@@ -1,3 +1,4 @@
+import logging
 import os
 from typing import List, Optional
 
@@ -16,11 +17,18 @@ class P4Client(VCSClient):
         self.p4 = P4()
 
         self.config = config
-        self.workspace_root = self.get_workspace_root()
+        # Resolved on first use: it needs a connection and a `p4 info` round trip.
+        self._workspace_root: Optional[str] = None
         self.p4.exception_level = (
             1  # File(s) up-to-date is a warning - no exception raised
         )
 
+    @property
+    def workspace_root(self) -> str:
+        if self._workspace_root is None:
+            self._workspace_root = self.get_workspace_root()
+        return self._workspace_root
+
     @property
     def is_connected(self) -> bool:
         return self.p4.connected()
@@ -99,7 +107,7 @@ class P4Client(VCSClient):
                     "Please shelve or submit them before switching branches."
                 )
 
-            os.chdir(self.get_workspace_root())
+            os.chdir(self.workspace_root)
             self.p4.run("switch", ref)
             self.p4.run_sync()
         except P4Exception as e:
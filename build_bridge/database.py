@@ -6,7 +6,7 @@ import os
 import platform
 from alembic.config import Config
 from alembic import command
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from pathlib import Path
@@ -16,29 +16,51 @@ from build_bridge.utils.paths import get_resource_path
 
 Base = declarative_base()
 
-# Check for an environment variable for the database path
-env_db_path = os.getenv("BUILD_BRIDGE_DB_PATH")
 
-if env_db_path:
-    db_path = Path(env_db_path)
-else:
+def _resolve_db_path() -> Path:
+    """Location of the app database."""
+    # Check for an environment variable for the database path
+    env_db_path = os.getenv("BUILD_BRIDGE_DB_PATH")
+    if env_db_path:
+        return Path(env_db_path)
+
     # Determine the application data directory based on the operating system using pathlib
-    if platform.system() == "Windows":
+    system = platform.system()
+    if system == "Windows":
         app_data_location = Path(os.getenv("APPDATA")) / "BuildBridge"
-    elif platform.system() == "Darwin":  # macOS
+    elif system == "Darwin":  # macOS
         app_data_location = (
             Path.home() / "Library" / "Application Support" / "BuildBridge"
         )
     else:  # Linux and other Unix-like systems
         app_data_location = Path.home() / ".local" / "share" / "BuildBridge"
 
-    db_path = app_data_location / "build_bridge.db"
+    return app_data_location / "build_bridge.db"
 
 
+db_path = _resolve_db_path()
 DATABASE_URL = f"sqlite:///{db_path}"
-engine = create_engine(DATABASE_URL)
+# Dialogs keep their own sessions open at the same time, so the default
+# per-connection pool is kept; the busy timeout lets a writer wait for
+# another session's lock instead of failing with "database is locked".
+engine = create_engine(DATABASE_URL, connect_args={"timeout": 30})
+
+
+@event.listens_for(engine, "connect")
+def _configure_sqlite_connection(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    # WAL lets readers run alongside a writer; NORMAL sync is safe under WAL
+    # and avoids an fsync on every commit.
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
 
-SessionFactory = sessionmaker(bind=engine)
+# Views re-read what they need with an explicit expire_all() when another
+# session may have changed it, so committing does not need to expire every
+# loaded object and force a re-SELECT on the next attribute access.
+SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
 
 
 def ensure_database_integrity(engine, alembic_cfg):
@@ -89,7 +111,6 @@ def run_pending_migrations(alembic_cfg):
     from alembic.script import ScriptDirectory
     from alembic.runtime.migration import MigrationContext
 
-    engine = create_engine(DATABASE_URL)
     with engine.connect() as conn:
         context = MigrationContext.configure(conn)
         current_rev = context.get_current_revision()
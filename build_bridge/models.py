@@ -1,6 +1,8 @@
 import logging
 import enum
 import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -9,6 +11,7 @@ from sqlalchemy.orm import relationship, validates, Mapped, mapped_column
 import keyring
 
 from build_bridge.database import Base
+from build_bridge.utils.paths import existing_paths
 
 
 class VCSTypeEnum(str, enum.Enum):
@@ -67,7 +70,7 @@ class BuildTarget(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
-    project_id = Column(Integer, ForeignKey("project.id"), nullable=False)
+    project_id = Column(Integer, ForeignKey("project.id"), nullable=False, index=True)
     project = relationship("Project", back_populates="build_targets")
 
     name = Column(String, nullable=False, default="")
@@ -106,7 +109,7 @@ class Build(Base):
     __tablename__ = "builds"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    build_target_id = Column(Integer, ForeignKey("build_targets.id"), nullable=False)
+    build_target_id = Column(Integer, ForeignKey("build_targets.id"), nullable=False, index=True)
     build_target = relationship("BuildTarget", back_populates="builds")
 
     version = Column(String, nullable=False)
@@ -158,8 +161,9 @@ class SteamPublishProfile(PublishProfile):
         Raises:
             ValueError: If any depot path does not exist.
         """
+        present = existing_paths(depots.values())
         for depot_id, depot_path in depots.items():
-            if not os.path.exists(depot_path):
+            if depot_path not in present:
                 raise ValueError(
                     f"Depot path {depot_path} for depot {depot_id} does not exist."
                 )
@@ -172,6 +176,47 @@ class SteamPublishProfile(PublishProfile):
             return str(self.build_target.builds_path / "Steam")
 
 
+# Secrets already read from or written to the OS keyring in this process. Each
+# config row is loaded in several sessions (settings, publish, preflight), so
+# the per-instance caches alone still hit the keyring once per session.
+# Entries expire so a secret changed outside the app is picked up again.
+KEYRING_CACHE_TTL_SECONDS = 300
+_KEYRING_CACHE: dict[tuple[str, str], tuple[float, str]] = {}
+_KEYRING_CACHE_LOCK = threading.Lock()
+
+
+def _get_keyring_secret(service_id: str, username: str) -> Optional[str]:
+    key = (service_id, username)
+    with _KEYRING_CACHE_LOCK:
+        cached = _KEYRING_CACHE.get(key)
+        if cached is not None:
+            expires_at, secret = cached
+            if time.monotonic() < expires_at:
+                return secret
+            del _KEYRING_CACHE[key]
+
+    secret = keyring.get_password(service_id, username)
+    if secret is not None:
+        _cache_keyring_secret(key, secret)
+    return secret
+
+
+def _cache_keyring_secret(key: tuple[str, str], secret: str):
+    with _KEYRING_CACHE_LOCK:
+        _KEYRING_CACHE[key] = (time.monotonic() + KEYRING_CACHE_TTL_SECONDS, secret)
+
+
+def _set_keyring_secret(service_id: str, username: str, value: str):
+    keyring.set_password(service_id, username, value)
+    _cache_keyring_secret((service_id, username), value)
+
+
+def _delete_keyring_secret(service_id: str, username: str):
+    with _KEYRING_CACHE_LOCK:
+        _KEYRING_CACHE.pop((service_id, username), None)
+    keyring.delete_password(service_id, username)
+
+
 class SteamConfig(Base):
     __tablename__ = "steam_config"
 
@@ -192,7 +237,7 @@ class SteamConfig(Base):
     @property
     def password(self):
         if self._password is None:
-            self._password = keyring.get_password(
+            self._password = _get_keyring_secret(
                 self._keyring_service_id, self.username
             )
         return self._password
@@ -200,7 +245,7 @@ class SteamConfig(Base):
     @password.setter
     def password(self, value):
         try:
-            keyring.set_password(self._keyring_service_id, self.username, value)
+            _set_keyring_secret(self._keyring_service_id, self.username, value)
             self._password = value
         except keyring.errors.KeyringError as e:
             raise RuntimeError(f"Failed to store Steam password: {e}") from e
@@ -267,7 +312,7 @@ class ItchConfig(Base):
                 return None
 
             try:
-                self._api_key = keyring.get_password(service_id, key_name)
+                self._api_key = _get_keyring_secret(service_id, key_name)
             except keyring.errors.PasswordNotFoundError:
                 logging.info(f"ItchConfigModel:No Itch API key found in keyring for {service_id}/{key_name}.")
                 self._api_key = None
@@ -298,7 +343,7 @@ class ItchConfig(Base):
 
         if not value:
             try:
-                keyring.delete_password(service_id, key_name)
+                _delete_keyring_secret(service_id, key_name)
                 self._api_key = None
                 logging.info(f"Itch API key cleared from keyring for {service_id}/{key_name}.")
             except keyring.errors.PasswordDeleteError:
@@ -311,7 +356,7 @@ class ItchConfig(Base):
                 )
         else:
             try:
-                keyring.set_password(service_id, key_name, value)
+                _set_keyring_secret(service_id, key_name, value)
                 self._api_key = value
                 logging.info(
                     f"Itch API key stored securely in keyring for {service_id}/{key_name}."
@@ -363,13 +408,13 @@ class PerforceConfig(VCSConfig):
     @property
     def p4password(self):
         if self._p4password is None:
-            self._p4password = keyring.get_password(self._keyring_service_id, self.user)
+            self._p4password = _get_keyring_secret(self._keyring_service_id, self.user)
         return self._p4password
 
     @p4password.setter
     def p4password(self, value):
         try:
-            keyring.set_password(self._keyring_service_id, self.user, value)
+            _set_keyring_secret(self._keyring_service_id, self.user, value)
             self._p4password = value
         except keyring.errors.KeyringError as e:
             raise RuntimeError(f"Failed to store Perforce password: {e}") from e
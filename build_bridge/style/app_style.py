@@ -24,6 +24,28 @@ QLabel#sectionTitle {
     font-weight: 700;
 }
 
+QLabel#subsectionTitle {
+    color: #20242a;
+    font-size: 16px;
+    font-weight: 700;
+}
+
+QLabel#hintText {
+    color: #808080;
+    font-size: 9pt;
+}
+
+QLabel#pageIndicator {
+    color: #808080;
+    padding: 4px 10px;
+}
+
+QLabel#pageIndicator[current="true"] {
+    background-color: #000000;
+    color: #ffffff;
+    border-radius: 10px;
+}
+
 QLabel#sectionSubtitle {
     color: #66707c;
     font-size: 12px;
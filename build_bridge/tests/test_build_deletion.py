@@ -6,8 +6,10 @@ from build_bridge.core.builds import (
     BuildExistsError,
     UnsafeBuildPathError,
     delete_build,
+    has_windows_executable,
     prepare_build_output_directory,
     register_successful_build,
+    scan_build_folders,
 )
 from build_bridge.database import Base
 from build_bridge.models import (
@@ -141,3 +143,50 @@ def test_prepare_build_output_directory_clears_existing_path_when_overwrite_is_a
 
     assert build_dir.exists()
     assert list(build_dir.iterdir()) == []
+
+
+def test_prepare_build_output_directory_unlinks_symlinked_dirs_without_following(tmp_path):
+    build_dir = tmp_path / "Builds" / "1.2.3"
+    build_dir.mkdir(parents=True)
+    outside_dir = tmp_path / "Shared"
+    outside_dir.mkdir()
+    (outside_dir / "keep.txt").touch()
+    try:
+        (build_dir / "Shared").symlink_to(outside_dir, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks are not available")
+
+    prepare_build_output_directory(str(build_dir), overwrite=True)
+
+    assert list(build_dir.iterdir()) == []
+    assert (outside_dir / "keep.txt").exists()
+
+
+def test_scan_build_folders_lists_version_folders_sorted_and_skips_targets(tmp_path):
+    (tmp_path / "1.1").mkdir()
+    (tmp_path / "1.0").mkdir()
+    (tmp_path / "Main").mkdir()
+    (tmp_path / "notes.txt").write_text("not a build")
+
+    folders = scan_build_folders(str(tmp_path), skip_names={"Main"})
+
+    assert [name for name, _, _ in folders] == ["1.0", "1.1"]
+    assert folders[0][1] == str(tmp_path / "1.0")
+    assert folders[0][2] == (tmp_path / "1.0").stat().st_mtime
+
+
+def test_scan_build_folders_raises_for_missing_root(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        scan_build_folders(str(tmp_path / "missing"))
+
+
+def test_has_windows_executable_checks_root_and_first_subfolder(tmp_path):
+    assert has_windows_executable(str(tmp_path)) is False
+
+    game_dir = tmp_path / "Windows"
+    game_dir.mkdir()
+    (game_dir / "MyGame.exe").touch()
+    assert has_windows_executable(str(tmp_path)) is True
+
+    (tmp_path / "Launcher.EXE").touch()
+    assert has_windows_executable(str(tmp_path)) is True
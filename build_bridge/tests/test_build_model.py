@@ -17,7 +17,9 @@ from build_bridge.models import (
     ItchPublishProfile,
     Project,
     StoreEnum,
+    SteamConfig,
 )
+from build_bridge import models
 from build_bridge.core.projects import get_active_project, set_active_project
 
 
@@ -174,3 +176,54 @@ class TestBuildModel:
             sess.commit()
 
             assert get_active_project(sess).id == second.id
+
+
+class TestKeyringSecrets:
+    @pytest.fixture(autouse=True)
+    def fake_keyring(self, monkeypatch):
+        store = {}
+        calls = {"get": 0}
+
+        def get_password(service_id, username):
+            calls["get"] += 1
+            return store.get((service_id, username))
+
+        def set_password(service_id, username, value):
+            store[(service_id, username)] = value
+
+        monkeypatch.setattr(models.keyring, "get_password", get_password)
+        monkeypatch.setattr(models.keyring, "set_password", set_password)
+        monkeypatch.setattr(models, "_KEYRING_CACHE", {})
+        return store, calls
+
+    def test_secret_is_read_from_keyring_once_across_instances(self, fake_keyring):
+        store, calls = fake_keyring
+        store[("BuildBridgeSteamAuth:1:builder", "builder")] = "hunter2"
+
+        first = SteamConfig(id=1, username="builder")
+        second = SteamConfig(id=1, username="builder")
+
+        assert first.password == "hunter2"
+        assert second.password == "hunter2"
+        assert calls["get"] == 1
+
+    def test_setting_a_secret_updates_the_cache(self, fake_keyring):
+        store, calls = fake_keyring
+        SteamConfig(id=1, username="builder").password = "new-secret"
+
+        assert SteamConfig(id=1, username="builder").password == "new-secret"
+        assert calls["get"] == 0
+
+    def test_cached_secret_expires_after_ttl(self, fake_keyring, monkeypatch):
+        store, calls = fake_keyring
+        store[("BuildBridgeSteamAuth:1:builder", "builder")] = "hunter2"
+        now = [1000.0]
+        monkeypatch.setattr(models.time, "monotonic", lambda: now[0])
+
+        assert SteamConfig(id=1, username="builder").password == "hunter2"
+        store[("BuildBridgeSteamAuth:1:builder", "builder")] = "rotated"
+        assert SteamConfig(id=1, username="builder").password == "hunter2"
+
+        now[0] += models.KEYRING_CACHE_TTL_SECONDS + 1
+        assert SteamConfig(id=1, username="builder").password == "rotated"
+        assert calls["get"] == 2
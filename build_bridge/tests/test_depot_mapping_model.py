@@ -0,0 +1,34 @@
+from PyQt6.QtCore import Qt
+
+from build_bridge.views.widgets.publish_profile_edit_widget_steam import DepotMappingModel
+
+
+def test_model_exposes_depots_as_string_rows():
+    model = DepotMappingModel({481: "/builds/win", "482": None})
+
+    assert model.rowCount() == 2
+    assert model.columnCount() == 3
+    assert model.data(model.index(0, DepotMappingModel.ID_COLUMN)) == "481"
+    assert model.data(model.index(1, DepotMappingModel.PATH_COLUMN)) == ""
+    assert model.rows() == [("481", "/builds/win"), ("482", "")]
+
+
+def test_browse_column_is_not_editable():
+    model = DepotMappingModel({481: "/builds/win"})
+    browse_index = model.index(0, DepotMappingModel.BROWSE_COLUMN)
+
+    assert not model.flags(browse_index) & Qt.ItemFlag.ItemIsEditable
+    assert not model.setData(browse_index, "ignored")
+    assert model.data(browse_index) is None
+
+
+def test_insert_edit_and_remove_rows():
+    model = DepotMappingModel({481: "/builds/win"})
+
+    assert model.insertRows(model.rowCount(), 1)
+    assert model.setData(model.index(1, DepotMappingModel.ID_COLUMN), 482)
+    assert model.setData(model.index(1, DepotMappingModel.PATH_COLUMN), "/builds/mac")
+    assert model.rows() == [("481", "/builds/win"), ("482", "/builds/mac")]
+
+    assert model.removeRows(0, 1)
+    assert model.rows() == [("482", "/builds/mac")]
@@ -0,0 +1,36 @@
+from build_bridge.core.publisher.itch.itch_publisher import check_itch_success
+from build_bridge.core.publisher.steam.steam_publisher import check_steam_success
+
+
+class TestItchSuccessCheck:
+    def test_success_requires_indicator_and_zero_exit_code(self):
+        log = "Pushing 12 files...\nBuild is processed, everything is fine\n"
+
+        assert check_itch_success(0, log) is True
+        assert check_itch_success(1, log) is False
+        assert check_itch_success(0, "Pushing 12 files...\n") is False
+
+    def test_error_indicators_fail_the_upload(self):
+        assert check_itch_success(0, "Patch applied\nInvalid API key\n") is False
+        assert check_itch_success(0, "Tasks ended.\nERROR: could not connect\n") is False
+
+
+class TestSteamSuccessCheck:
+    LOG = (
+        "Logging in user 'builder' to Steam Public...OK\n"
+        "Uploading content...\n"
+        "Successfully finished AppID 480 build (BuildID 123).\n"
+    )
+
+    def test_success_requires_login_build_and_zero_exit_code(self):
+        assert check_steam_success(0, self.LOG) is True
+        assert check_steam_success(5, self.LOG) is False
+        assert check_steam_success(0, "Successfully finished AppID 480 build\n") is False
+        assert check_steam_success(0, "Logging in user 'builder' to Steam Public...OK\n") is False
+
+    def test_error_indicators_fail_the_upload(self):
+        assert check_steam_success(0, self.LOG + "ERROR! Failed to commit build\n") is False
+        assert check_steam_success(0, self.LOG + "Upload failed\n") is False
+
+    def test_stderr_log_path_is_not_an_error(self):
+        assert check_steam_success(0, self.LOG + "See logs/stderr.txt for details\n") is True
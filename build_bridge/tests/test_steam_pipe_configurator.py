@@ -0,0 +1,85 @@
+import dataclasses
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+from build_bridge.core.publisher.steam.steam_pipe_configurator import SteamPipeConfigurator
+from build_bridge.core.publisher.steam.steam_publish_snapshot import SteamPublishSnapshot
+
+
+def _make_snapshot(tmp_path, depots=None):
+    return SteamPublishSnapshot(
+        app_id=480,
+        description="Main",
+        builder_path=str(tmp_path / "Steam"),
+        steamcmd_path=str(tmp_path / "steamcmd.exe"),
+        username="builder",
+        password="",
+        depots=depots if depots is not None else {481: str(tmp_path / "Build")},
+    )
+
+
+def test_vdf_file_renders_profile_values(tmp_path):
+    snapshot = _make_snapshot(tmp_path)
+
+    vdf_path = SteamPipeConfigurator(snapshot).create_or_update_vdf_file(
+        content_root=str(tmp_path / "Build")
+    )
+
+    content = (tmp_path / "Steam" / "app_build.vdf").read_text(encoding="utf-8")
+    assert vdf_path == str(tmp_path / "Steam" / "app_build.vdf")
+    assert '"AppID" "480"' in content
+    assert '"481" // your DepotID' in content
+    assert (tmp_path / "Steam" / "BuildLogs").is_dir()
+
+
+def test_template_is_compiled_once(tmp_path):
+    SteamPipeConfigurator(_make_snapshot(tmp_path)).create_or_update_vdf_file(str(tmp_path))
+    template = SteamPipeConfigurator._template
+
+    SteamPipeConfigurator(_make_snapshot(tmp_path)).create_or_update_vdf_file(str(tmp_path))
+
+    assert template is not None
+    assert SteamPipeConfigurator._template is template
+
+
+def test_unchanged_vdf_file_is_not_rewritten(tmp_path):
+    configurator = SteamPipeConfigurator(_make_snapshot(tmp_path))
+    vdf_path = Path(configurator.create_or_update_vdf_file(str(tmp_path / "Build")))
+    os.utime(vdf_path, ns=(0, 0))
+
+    configurator.create_or_update_vdf_file(str(tmp_path / "Build"))
+    assert vdf_path.stat().st_mtime_ns == 0
+
+    configurator = SteamPipeConfigurator(dataclasses.replace(configurator.snapshot, app_id=481))
+    configurator.create_or_update_vdf_file(str(tmp_path / "Build"))
+    assert '"AppID" "481"' in vdf_path.read_text(encoding="utf-8")
+    assert not vdf_path.with_name("app_build.vdf.tmp").exists()
+
+
+def test_snapshot_copies_profile_fields(tmp_path):
+    steam_config = SimpleNamespace(
+        steamcmd_path="C:/steamcmd/steamcmd.exe", username="builder", password=None
+    )
+    depots = {"481": str(tmp_path)}
+    profile = SimpleNamespace(
+        app_id=480,
+        description="Main",
+        builder_path=str(tmp_path / "Steam"),
+        depots=depots,
+        steam_config=steam_config,
+        project=SimpleNamespace(name="Game"),
+    )
+
+    snapshot = SteamPublishSnapshot.from_profile(profile)
+
+    assert snapshot.password == ""
+    assert snapshot.project_name == "Game"
+    assert snapshot.depots == depots and snapshot.depots is not depots
+
+
+def test_snapshot_repr_hides_password(tmp_path):
+    snapshot = dataclasses.replace(_make_snapshot(tmp_path), password="hunter2")
+
+    assert "hunter2" not in repr(snapshot)
+    assert snapshot.password == "hunter2"
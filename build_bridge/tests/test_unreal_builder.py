@@ -1,10 +1,15 @@
+import os
+
 import pytest
 
+from build_bridge.core.builder import unreal_builder
 from build_bridge.core.builder.unreal_builder import BuildAlreadyExistsError, UnrealBuilder
 from build_bridge.views.widgets.build_targets_widget import BuildTargetRow
 
 
-def _make_unreal_builder(tmp_path, maps, output_dir=None, allow_existing_output_dir=False):
+def _make_unreal_builder(
+    tmp_path, maps, output_dir=None, allow_existing_output_dir=False, uproject_path=None
+):
     project_dir = tmp_path / "Project"
     project_dir.mkdir()
     (project_dir / "MyGame.uproject").write_text('{"EngineAssociation": "5.3"}')
@@ -28,6 +33,7 @@ def _make_unreal_builder(tmp_path, maps, output_dir=None, allow_existing_output_
         maps=maps,
         output_dir=str(output_dir or tmp_path / "Builds" / "MyGame"),
         allow_existing_output_dir=allow_existing_output_dir,
+        uproject_path=uproject_path,
     )
 
 
@@ -72,6 +78,41 @@ class TestUnrealBuilderMaps:
         assert builder.output_dir == str(output_dir)
 
 
+class TestUnrealBuilderProjectFile:
+    def test_known_uproject_path_skips_project_search(self, tmp_path, monkeypatch):
+        def fail_search(self, recurse_level=1):
+            raise AssertionError("project search should be skipped")
+
+        monkeypatch.setattr(UnrealBuilder, "get_uproject_path", fail_search)
+        uproject_path = tmp_path / "Project" / "MyGame.uproject"
+
+        builder = _make_unreal_builder(tmp_path, [], uproject_path=str(uproject_path))
+
+        assert builder.uproj_path == str(uproject_path)
+
+    def test_engine_version_reparsed_only_when_uproject_changes(self, tmp_path, monkeypatch):
+        builder = _make_unreal_builder(tmp_path, [])
+        uproject = tmp_path / "Project" / "MyGame.uproject"
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("cached .uproject should not be parsed again")
+
+        monkeypatch.setattr(unreal_builder.json, "load", fail_load)
+        assert builder.get_engine_version_from_uproj() == "5.3"
+
+        monkeypatch.undo()
+        uproject.write_text('{"EngineAssociation": "5.4"}')
+        os.utime(uproject, ns=(0, uproject.stat().st_mtime_ns + 1_000_000_000))
+        assert builder.get_engine_version_from_uproj() == "5.4"
+
+    def test_missing_uproject_path_falls_back_to_search(self, tmp_path):
+        builder = _make_unreal_builder(
+            tmp_path, [], uproject_path=str(tmp_path / "Gone.uproject")
+        )
+
+        assert builder.uproj_path == str(tmp_path / "Project" / "MyGame.uproject")
+
+
 class TestUmapPathConversion:
     def test_project_content_root_map_has_no_double_slash(self, tmp_path):
         project_dir = tmp_path / "Project"
@@ -1,7 +1,28 @@
-from build_bridge.utils.paths import unc_join_path
+from build_bridge.utils.paths import existing_paths, unc_join_path
 
 
 def test_unc_path_join():
     a = "C:/Builds"
     b = "//depot/release"
-    assert unc_join_path(a, b) == "C:/Builds/depot/release"
\ No newline at end of file
+    assert unc_join_path(a, b) == "C:/Builds/depot/release"
+
+
+def test_existing_paths_matches_os_path_exists(tmp_path):
+    (tmp_path / "Win64").mkdir()
+    (tmp_path / "Linux").mkdir()
+    (tmp_path / "notes.txt").touch()
+    candidates = [
+        str(tmp_path / "Win64"),
+        str(tmp_path / "Linux"),
+        str(tmp_path / "notes.txt"),
+        str(tmp_path / "Mac"),
+        str(tmp_path / "missing" / "Win64"),
+        str(tmp_path) + "/",
+    ]
+
+    assert existing_paths(candidates) == {
+        str(tmp_path / "Win64"),
+        str(tmp_path / "Linux"),
+        str(tmp_path / "notes.txt"),
+        str(tmp_path) + "/",
+    }
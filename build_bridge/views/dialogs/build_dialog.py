@@ -1,11 +1,13 @@
+import codecs
 import os, logging
+import signal
 import subprocess
 import platform
 
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
-    QTextEdit,
+    QPlainTextEdit,
     QPushButton,
     QHBoxLayout,
     QMessageBox,
@@ -13,13 +15,25 @@ from PyQt6.QtWidgets import (
     QCheckBox,
     QLineEdit,
 )
-from PyQt6.QtCore import QProcess, pyqtSignal, Qt
-from PyQt6.QtGui import QIcon, QTextCursor, QTextDocument
+from PyQt6.QtCore import QProcess, QTimer, pyqtSignal, Qt
+from PyQt6.QtGui import (
+    QIcon,
+    QTextBlockFormat,
+    QTextCharFormat,
+    QTextCursor,
+    QTextDocument,
+)
 
 from build_bridge.core.builder.unreal_builder import UnrealBuilder
 from build_bridge.utils.paths import get_resource_path
 
 
+# Oldest lines beyond this are dropped from the on-screen build log.
+MAX_LOG_LINES = 20000
+# How long a cancelled build gets to report its exit before the dialog stops waiting.
+CANCEL_GRACE_MS = 2000
+
+
 class BuildWindowDialog(QDialog):
     build_ready_signal = pyqtSignal()
     build_failed_signal = pyqtSignal()
@@ -30,6 +44,19 @@ class BuildWindowDialog(QDialog):
         self.build_in_progress = False
         self.process = None
         self._current_pid = None
+        self._cancelling = False
+        self._close_after_cancel = False
+        self._build_command: list[str] | None = None
+        # Build output is buffered and appended to the log in batches, so a
+        # chatty UAT run costs one document update per batch, not per chunk.
+        self._pending_output = bytearray()
+        # Decoded text after the last newline, held until its line completes.
+        self._partial_line = ""
+        self._output_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._output_flush_timer = QTimer(self)
+        self._output_flush_timer.setSingleShot(True)
+        self._output_flush_timer.setInterval(50)
+        self._output_flush_timer.timeout.connect(self.flush_output)
         self.setup_ui()
         if auto_start:
             self.start_build()
@@ -67,16 +94,22 @@ class BuildWindowDialog(QDialog):
         self.layout.addWidget(self.search_layout_widget)
 
         # Build output log (single instance)
-        self.output_text = QTextEdit()
+        # QPlainTextEdit lays out block by block and drops the oldest lines past
+        # the cap, so appending stays cheap however long the build runs.
+        # append_output inserts colored lines through one QTextCursor edit block
+        # (insertBlock + insertHtml per line).
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
         self.output_text.setMinimumHeight(200)
-        self.output_text.setAcceptRichText(True)  # for color coding
+        self.output_text.setUndoRedoEnabled(False)
+        self.output_text.setMaximumBlockCount(MAX_LOG_LINES)
         self.layout.addWidget(self.output_text)
 
         # Button layout (remove duplicate)
         self.button_layout = QHBoxLayout()
         self.action_button = QPushButton("Cancel Build")
-        self.action_button.clicked.connect(self.cancel_build)
+        self._action_state = "cancel"
+        self.action_button.clicked.connect(self._on_action_clicked)
         self.search_toggle_button = QPushButton("Search (Ctrl+F)")
         self.search_toggle_button.setCheckable(True)
         self.search_toggle_button.clicked.connect(self._toggle_search)
@@ -96,42 +129,83 @@ class BuildWindowDialog(QDialog):
                 return
 
             self._cleanup_process_state()
+            self._pending_output.clear()
+            self._partial_line = ""
+            self._output_decoder.reset()
             self.build_in_progress = True
             self.process = QProcess(self)
+            # UAT reports compile errors on stderr; merge it so handle_output
+            # sees both streams through a single channel.
+            self.process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
             self.process.readyReadStandardOutput.connect(self.handle_output)
+            self.process.started.connect(self.handle_started)
             self.process.finished.connect(self.build_finished)
             self.process.errorOccurred.connect(self.handle_error)
+            if platform.system() != "Windows":
+                # Run UAT in its own session so cancelling can kill its whole
+                # process group without touching the app's own group.
+                self.process.setUnixProcessParameters(
+                    QProcess.UnixProcessFlag.CreateNewSession
+                )
 
-            command = self.builder.get_build_command()
+            # The builder is fixed for the dialog's lifetime, so a retry reuses
+            # the command built for the first attempt.
+            if self._build_command is None:
+                self._build_command = self.builder.get_build_command()
+            command = self._build_command
             program = command[0]
             arguments = command[1:]
 
+            command_line = " ".join(command)
             self.append_output("Starting build...\n")
-            self.append_output(f"Command: {program} {' '.join(arguments)}\n")
-            logging.info(f"Starting build: {program} {' '.join(arguments)}")
-
+            self.append_output(f"Command: {command_line}\n")
+            logging.info(f"Starting build: {command_line}")
+
+            # Set before start(): a FailedToStart error can be emitted from
+            # inside start() and switches the button to "close" itself.
+            self._set_action_state("cancel")
+            # Startup is reported through started/errorOccurred, so the dialog
+            # stays responsive while UAT launches.
             self.process.start(program, arguments)
-            self._set_action_button("Cancel Build", self.cancel_build)
-
-            if not self.process.waitForStarted(5000):
-                raise Exception(
-                    f"ERROR: Failed to start process: {self.process.errorString()}"
-                )
-            self._current_pid = self.process.processId()
         except Exception as e:
             self.append_output(f"ERROR: Failed to start build: {str(e)}")
             logging.info(f"Build start failed: {str(e)}", exc_info=True)
             self.build_finished(-1, QProcess.ExitStatus.CrashExit)
 
+    def handle_started(self):
+        if self.process:
+            self._current_pid = self.process.processId()
+
     def handle_output(self):
         if self.build_in_progress:
-            data = (
-                self.process.readAllStandardOutput()
-                .data()
-                .decode("utf-8", errors="replace")
-            )
-            self.append_output(data)
-            logging.info(f"Process output: {data.strip()}")
+            self._pending_output += self.process.readAllStandardOutput().data()
+            if not self._output_flush_timer.isActive():
+                self._output_flush_timer.start()
+
+    def flush_output(self, final: bool = False):
+        """Append buffered output up to the last complete line (or all of it if final)."""
+        self._output_flush_timer.stop()
+        # One decode per batch; the incremental decoder carries a multi-byte
+        # character split across reads over to the next batch.
+        text = self._partial_line + self._output_decoder.decode(
+            self._pending_output, final
+        )
+        self._pending_output.clear()
+        if final:
+            end = len(text)
+        else:
+            end = text.rfind("\n") + 1
+        self._partial_line = text[end:]
+        if not end:
+            return
+
+        data = text[:end]
+        self.append_output(data)
+        # UAT keeps its own full log; echoing every batch into app.log only
+        # rotates the app's own messages out, so it is debug-only and skipped
+        # entirely unless enabled.
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Process output: %s", data.strip())
 
     def cancel_build(self):
         """Immediately force-cancel the running build."""
@@ -140,29 +214,49 @@ class BuildWindowDialog(QDialog):
             return
 
         try:
+            self.flush_output(final=True)
             self.action_button.setEnabled(False)
             self.append_output("\nWARNING: Cancelling build (forcing termination)...")
             logging.info("Attempting to force-cancel build")
 
+            self._cancelling = True
             pid = self.process.processId() if self.process else self._current_pid
             self._terminate_process_tree(pid)
-            self._wait_for_process_exit()
-
+            # The dialog resets once finished reports the exit; this only
+            # catches a process that ignores the kill.
+            process = self.process
+            QTimer.singleShot(
+                CANCEL_GRACE_MS, lambda: self._verify_cancelled(process)
+            )
         except Exception as e:
             self.append_output(f"ERROR: Cancel failed: {str(e)}")
             logging.info(f"Force cancel failed: {str(e)}", exc_info=True)
-        finally:
             self.reset_after_cancel()
 
+    def _verify_cancelled(self, process: QProcess):
+        if not self._cancelling or process is not self.process:
+            return
+        if process.state() != QProcess.ProcessState.NotRunning:
+            self.append_output("WARNING: Process may still be running!")
+            logging.info("Process may not have terminated after forced cancellation.")
+        self.reset_after_cancel()
+
     def reset_after_cancel(self):
+        self._cancelling = False
         self.build_in_progress = False
         self._cleanup_process_state()
         self.build_failed_signal.emit()
-        self._set_action_button("Retry Build", self.start_build)
+        self._set_action_state("retry")
         self.action_button.setEnabled(True)
+        if self._close_after_cancel:
+            self.close()
 
     def closeEvent(self, event):
         if self.build_in_progress:
+            if self._close_after_cancel:
+                # Already cancelling; the dialog closes once the build exits.
+                event.ignore()
+                return
             reply = QMessageBox.question(
                 self,
                 "Build in progress",
@@ -173,17 +267,33 @@ class BuildWindowDialog(QDialog):
             if reply != QMessageBox.StandardButton.Yes:
                 event.ignore()
                 return
+            self._close_after_cancel = True
             self.cancel_build()
-        else:
-            self._cleanup_process_state()
+            if self.build_in_progress:
+                event.ignore()
+                return
+        self._close_after_cancel = False
         event.accept()
 
-    def handle_error(self):
+    def handle_error(self, error: QProcess.ProcessError):
         """Handle QProcess errors."""
         if not self.process:
             return
 
         error_string = self.process.errorString()
+        if error == QProcess.ProcessError.FailedToStart:
+            self.append_output(f"ERROR: Failed to start process: {error_string}")
+            logging.info(f"Build start failed: {error_string}")
+            # QProcess does not emit finished for a process that never started,
+            # and there is no process tree to kill, so detach before finishing.
+            self._cleanup_process_state()
+            self.build_finished(-1, QProcess.ExitStatus.CrashExit)
+            return
+
+        if self._cancelling:
+            # The kill itself surfaces as a crash; finished completes the cancel.
+            return
+
         self.append_output(f"ERROR: Process error: {error_string}\n")
         logging.info(f"Process error: {error_string}")
 
@@ -191,10 +301,24 @@ class BuildWindowDialog(QDialog):
         if self.build_in_progress:
             pid = self.process.processId() if self.process else self._current_pid
             self._terminate_process_tree(pid)
-            self._wait_for_process_exit()
+            # Checked later instead of blocking on waitForFinished; finished
+            # still drives the normal end-of-build handling.
+            process = self.process
+            QTimer.singleShot(
+                CANCEL_GRACE_MS, lambda: self._warn_if_still_running(process)
+            )
 
     def build_finished(self, exit_code, exit_status):
         """Handle build completion."""
+        if self.process and self.build_in_progress:
+            self._pending_output += self.process.readAllStandardOutput().data()
+        self.flush_output(final=True)
+        if self._cancelling:
+            self.append_output("Build cancelled.")
+            logging.info("Build cancelled")
+            self.reset_after_cancel()
+            return
+
         self.build_in_progress = False
         if exit_status != QProcess.ExitStatus.NormalExit or exit_code != 0:
             pid = self.process.processId() if self.process else self._current_pid
@@ -204,23 +328,37 @@ class BuildWindowDialog(QDialog):
             self.append_output("\nSUCCESS: BUILD COMPLETED SUCCESSFULLY")
             logging.info("Build completed successfully")
             self.build_ready_signal.emit()
-            self._set_action_button("Close", self.accept)
+            self._set_action_state("accept")
         else:
             self.append_output(f"\nERROR: BUILD FAILED (Exit code: {exit_code})")
             logging.info(f"Build failed with exit code {exit_code}")
             self.build_failed_signal.emit()
-            self._set_action_button("Close", self.close)
+            self._set_action_state("close")
 
         self._cleanup_process_state()
         self.action_button.setEnabled(True)
 
-    def _set_action_button(self, text, slot):
-        self.action_button.setText(text)
-        try:
-            self.action_button.clicked.disconnect()
-        except TypeError:
-            pass
-        self.action_button.clicked.connect(slot)
+    # The action button is wired once; its label and behaviour follow the state.
+    _ACTION_LABELS = {
+        "cancel": "Cancel Build",
+        "retry": "Retry Build",
+        "accept": "Close",
+        "close": "Close",
+    }
+
+    def _set_action_state(self, state: str):
+        self._action_state = state
+        self.action_button.setText(self._ACTION_LABELS[state])
+
+    def _on_action_clicked(self):
+        if self._action_state == "cancel":
+            self.cancel_build()
+        elif self._action_state == "retry":
+            self.start_build()
+        elif self._action_state == "accept":
+            self.accept()
+        else:
+            self.close()
 
     def _cleanup_process_state(self):
         if not self.process:
@@ -230,6 +368,10 @@ class BuildWindowDialog(QDialog):
             self.process.readyReadStandardOutput.disconnect(self.handle_output)
         except TypeError:
             pass
+        try:
+            self.process.started.disconnect(self.handle_started)
+        except TypeError:
+            pass
         try:
             self.process.finished.disconnect(self.build_finished)
         except TypeError:
@@ -241,13 +383,12 @@ class BuildWindowDialog(QDialog):
         self.process = None
         self._current_pid = None
 
-    def _wait_for_process_exit(self):
-        if not self.process:
+    def _warn_if_still_running(self, process: QProcess):
+        if process is not self.process:
             return
-        self.process.waitForFinished(2000)
-        if self.process.state() != QProcess.ProcessState.NotRunning:
+        if process.state() != QProcess.ProcessState.NotRunning:
             self.append_output("WARNING: Process may still be running!")
-            logging.info("Process may not have terminated after forced cancellation.")
+            logging.info("Process may not have terminated after a process error.")
 
     def _terminate_process_tree(self, pid):
         if not pid:
@@ -268,10 +409,10 @@ class BuildWindowDialog(QDialog):
                 logging.info(f"taskkill failed for PID {pid}: {result.stderr}")
         else:
             try:
-                pgid = os.getpgid(pid)
-                os.killpg(pgid, 9)  # SIGKILL
+                # The build leads its own session, so its pid is its group id.
+                os.killpg(pid, signal.SIGKILL)
                 self.append_output("SUCCESS: Build process and children terminated.")
-                logging.info(f"Process group {pgid} terminated via SIGKILL.")
+                logging.info(f"Process group {pid} terminated via SIGKILL.")
             except Exception as e:
                 self.append_output(
                     f"WARNING: Termination failed for PID {pid}: {str(e)}"
@@ -280,11 +421,21 @@ class BuildWindowDialog(QDialog):
 
     def append_output(self, text: str):
         try:
-            lines = text.strip().split("\n")
-            for line in lines:
-                if not line.strip():
+            # The whole batch goes in as one edit block and the view scrolls at
+            # most once, and only if it was already following the output.
+            scrollbar = self.output_text.verticalScrollBar()
+            follow_output = scrollbar.value() >= scrollbar.maximum()
+            document = self.output_text.document()
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.beginEditBlock()
+
+            # splitlines also drops the \r of Windows line endings, without
+            # copying the whole batch through strip() first.
+            for line in text.splitlines():
+                if not line or line.isspace():
                     continue
-                
+
                 line_upper = line.upper()
                 if ":" in line:
                     category = line.split(":", 1)[0]
@@ -301,10 +452,13 @@ class BuildWindowDialog(QDialog):
                     formatted_text = f'<span style="color: blue;">{formatted_line}</span>'
                 else:
                     formatted_text = formatted_line
-                self.output_text.append(formatted_text)
-            self.output_text.verticalScrollBar().setValue(
-                self.output_text.verticalScrollBar().maximum()
-            )
+                if not document.isEmpty():
+                    cursor.insertBlock(QTextBlockFormat(), QTextCharFormat())
+                cursor.insertHtml(formatted_text)
+
+            cursor.endEditBlock()
+            if follow_output:
+                scrollbar.setValue(scrollbar.maximum())
         except Exception as e:
             logging.info(f"Error updating GUI: {str(e)}", exc_info=True)
 
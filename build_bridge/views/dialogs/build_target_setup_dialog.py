@@ -28,14 +28,12 @@ from sqlalchemy import exists
 from build_bridge.utils.paths import get_resource_path
 from build_bridge.views.dialogs.settings_dialog import SettingsDialog
 
-from build_bridge.core.vcs.p4client import P4Client
 from build_bridge.core.projects import get_active_project
 from build_bridge.models import (
     BuildTarget,
     Project,
     BuildTargetPlatformEnum,
     BuildTypeEnum,
-    VCSTypeEnum,
 )
 from build_bridge.database import (
     SessionFactory,
@@ -43,7 +41,6 @@ from build_bridge.database import (
 
 
 class BuildTargetSetupDialog(QDialog):
-    vcs_clients = {VCSTypeEnum.perforce: P4Client}
     build_target_created = pyqtSignal(int)
 
     def __init__(self, build_target_id: int = None, project_id: int | None = None):
@@ -139,7 +136,7 @@ class BuildTargetSetupDialog(QDialog):
         # (Keep existing code)
         title_layout = QHBoxLayout()
         title = QLabel(title_text)
-        title.setStyleSheet("font-weight: bold; font-size: 18px;")
+        title.setObjectName("sectionTitle")
         title_layout.addWidget(title)
         return title_layout
 
@@ -149,7 +146,7 @@ class BuildTargetSetupDialog(QDialog):
 
         # Project section Label
         proj_label = QLabel("Project")
-        proj_label.setStyleSheet("font-weight: bold; font-size: 18px;")
+        proj_label.setObjectName("sectionTitle")
         layout.addWidget(proj_label)
 
         # === "Add Project" Button (conditionally visible) ===
@@ -287,7 +284,7 @@ class BuildTargetSetupDialog(QDialog):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         build_conf_label = QLabel("Build Config")
-        build_conf_label.setStyleSheet("font-weight: bold; font-size: 18px;")
+        build_conf_label.setObjectName("sectionTitle")
         layout.addWidget(build_conf_label)
 
         form = QFormLayout()
@@ -298,7 +295,7 @@ class BuildTargetSetupDialog(QDialog):
         self.optimize_hint = QLabel(
             "Will build using Valve\nRecommended padding alignment values"
         )
-        self.optimize_hint.setStyleSheet("color: gray; font-size: 10px;")
+        self.optimize_hint.setObjectName("hintText")
         optimize_layout = QVBoxLayout()
         optimize_layout.addWidget(self.optimize_checkbox)
         optimize_layout.addWidget(self.optimize_hint)
@@ -321,7 +318,7 @@ class BuildTargetSetupDialog(QDialog):
             "Provide directory of the engine version you want to use to build this: (e.g., UE_5.3). "
             "Relies on standard distributed binaries engine folder names (UE_x.y)."
         )
-        ue_path_explanation.setStyleSheet("color: gray; font-size: 9pt;") # Style as hint text
+        ue_path_explanation.setObjectName("hintText")
         ue_path_explanation.setWordWrap(True) # Allow text to wrap
 
         # Add the label on the next row, spanning both columns by providing an empty string for the label part
@@ -357,7 +354,7 @@ class BuildTargetSetupDialog(QDialog):
 
         form.addRow(optimize_layout)
         target_label = QLabel("Target and Maps")
-        target_label.setStyleSheet("font-weight: bold; font-size: 16px;")
+        target_label.setObjectName("subsectionTitle")
         form.addRow(target_label)     
         form.addRow(target_layout)
         layout.addLayout(form)
@@ -373,13 +370,12 @@ class BuildTargetSetupDialog(QDialog):
         footer_layout = QHBoxLayout()
         footer_layout.setAlignment(Qt.AlignmentFlag.AlignRight)
         self.page1_label = QLabel("1")
-        self.page1_label.setStyleSheet(
-            "background-color: black; color: white; padding: 4px 10px; border-radius: 10px;"
-        )
+        self.page1_label.setObjectName("pageIndicator")
         self.page1_label.mousePressEvent = self.page1_clicked
         self.page2_label = QLabel("2")
-        self.page2_label.setStyleSheet("color: gray; margin-left: 8px;")
+        self.page2_label.setObjectName("pageIndicator")
         self.page2_label.mousePressEvent = self.page2_clicked
+        self._set_current_page_indicator(self.page1_label)
         self.back_button = QPushButton("Back")
         self.back_button.clicked.connect(lambda: self.page1_clicked(None))
         self.back_button.hide()
@@ -397,22 +393,24 @@ class BuildTargetSetupDialog(QDialog):
         footer_layout.addWidget(self.save_button)
         return footer_layout
 
+    def _set_current_page_indicator(self, current_label: QLabel):
+        # The highlight comes from the pageIndicator[current="true"] rule in the
+        # app stylesheet; only the property flips, so no QSS is re-parsed.
+        for label in (self.page1_label, self.page2_label):
+            label.setProperty("current", label is current_label)
+            label.style().unpolish(label)
+            label.style().polish(label)
+
     def page1_clicked(self, event):
         self.stack.setCurrentIndex(0)
-        self.page1_label.setStyleSheet(
-            "background-color: black; color: white; padding: 4px 10px; border-radius: 10px;"
-        )
-        self.page2_label.setStyleSheet("color: gray; margin-left: 8px;")
+        self._set_current_page_indicator(self.page1_label)
         self.back_button.hide()
         self.next_button.show()
         self.save_button.hide()
 
     def page2_clicked(self, event):
         self.stack.setCurrentIndex(1)
-        self.page1_label.setStyleSheet("color: gray; margin-right: 8px;")
-        self.page2_label.setStyleSheet(
-            "background-color: black; color: white; padding: 4px 10px; border-radius: 10px;"
-        )
+        self._set_current_page_indicator(self.page2_label)
         self.back_button.show()
         self.next_button.hide()
         self.save_button.show()
@@ -481,15 +479,20 @@ class BuildTargetSetupDialog(QDialog):
         if not isinstance(maps_dict, dict):
             logging.info(f"Warning: Maps data is not a dictionary: {maps_dict}")
             return
-        for map_path in maps_dict.keys():
-            self._insert_map_row(table_widget, map_path)
+        # Fill all rows with repaints off so the table lays out once at the end.
+        table_widget.setUpdatesEnabled(False)
+        try:
+            for map_path in maps_dict.keys():
+                self._insert_map_row(table_widget, map_path)
+        finally:
+            table_widget.setUpdatesEnabled(True)
 
     def _browse_map_path(self, table_widget: QTableWidget, row):
         """Open a directory dialog to select a map path for the specified table."""
-        current_path_item = table_widget.item(row, 1)
+        path_item = table_widget.item(row, 0)
         start_dir = ""
-        if current_path_item and current_path_item.text():
-            start_dir = current_path_item.text()
+        if path_item and path_item.text():
+            start_dir = path_item.text()
 
         file_dialog = QFileDialog(self)
         file_dialog.setNameFilter("UMAP Files (*.umap)")
@@ -497,7 +500,11 @@ class BuildTargetSetupDialog(QDialog):
         file_dialog.setDirectory(os.path.dirname(start_dir))
         file_dialog.setOption(QFileDialog.Option.ReadOnly)
         if file_dialog.exec():
-            table_widget.setItem(row, 0, QTableWidgetItem(file_dialog.selectedFiles()[0]))
+            selected_path = file_dialog.selectedFiles()[0]
+            if path_item is None:
+                table_widget.setItem(row, 0, QTableWidgetItem(selected_path))
+            else:
+                path_item.setText(selected_path)
 
     def browse_folder(self):
         folder = QFileDialog.getExistingDirectory(
@@ -578,8 +585,9 @@ class BuildTargetSetupDialog(QDialog):
             Returns a dictionary of maps or None if validation fails.
         """
         maps_to_save = {}
+        item = table_widget.item
         for row in range(table_widget.rowCount()):
-            path_item = table_widget.item(row, 0)
+            path_item = item(row, 0)
 
             if not path_item or not path_item.text().strip():
                 QMessageBox.warning(self, "Validation Error", f"Map Path is missing in row {row+1}.")
@@ -1,3 +1,4 @@
+import codecs
 import logging
 
 from pathlib import Path
@@ -12,10 +13,14 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 from PyQt6.QtCore import QProcess, QProcessEnvironment, QTimer
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QIcon, QTextCursor
 
 from build_bridge.utils.paths import get_resource_path
 
+# How long a killed upload tool gets to report that it exited before the
+# dialog warns that it may still be running.
+CANCEL_GRACE_MS = 2000
+
 
 class GenericUploadDialog(QDialog):
     """
@@ -52,12 +57,23 @@ class GenericUploadDialog(QDialog):
 
         self.process: Optional[QProcess] = None
         self.upload_successful: bool = False  # Determined by success_checker
-        self._log_buffer: str = ""  # Accumulate log content
+        self._cancelling = False
+        # Log content is kept as a list of chunks and joined once for the
+        # success check, instead of re-copying a growing string per chunk.
+        self._log_chunks: List[str] = []
         self._tailed_log_positions: Dict[Path, int] = {}
         self._announced_log_files: set[Path] = set()
         self._log_tail_timer = QTimer(self)
         self._log_tail_timer.setInterval(500)
         self._log_tail_timer.timeout.connect(self.poll_tailed_logs)
+        # Process output is buffered and flushed to the view in batches so a
+        # chatty tool does not trigger a relayout per chunk.
+        self._pending_output = bytearray()
+        self._output_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._output_flush_timer = QTimer(self)
+        self._output_flush_timer.setSingleShot(True)
+        self._output_flush_timer.setInterval(100)
+        self._output_flush_timer.timeout.connect(self.flush_process_output)
 
         self.setWindowTitle(title)
         icon_path = str(get_resource_path("build_bridge/icons/buildbridge.ico"))
@@ -86,6 +102,12 @@ class GenericUploadDialog(QDialog):
         self.log_display.setReadOnly(True)
         self.log_display.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
         self.log_display.setFontFamily("monospace")
+        self.log_display.setAcceptRichText(False)
+        # A private cursor pinned to the end of the document: inserting plain
+        # text through it is much cheaper than QTextEdit.append, and it does not
+        # disturb the user's own selection.
+        self._log_cursor = QTextCursor(self.log_display.document())
+        self._log_char_format = self.log_display.currentCharFormat()
         main_layout.addWidget(self.log_display, 1)
 
         # --- Buttons ---
@@ -112,6 +134,7 @@ class GenericUploadDialog(QDialog):
         self.process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
         # Connect signals
         self.process.readyReadStandardOutput.connect(self.read_realtime_output)
+        self.process.started.connect(self.handle_process_started)
         self.process.finished.connect(self.handle_process_finished)
         self.process.errorOccurred.connect(self.handle_process_error)
 
@@ -142,40 +165,38 @@ class GenericUploadDialog(QDialog):
         if self.working_directory:
             self.process.setWorkingDirectory(self.working_directory)
 
+        # Startup is reported through the started/errorOccurred signals so the
+        # event loop keeps running while the OS launches the tool.
         self.process.start(str(self.executable), self.arguments)
 
-        if not self.process.waitForStarted(5000):
-            self.append_log(
-                f"[ERROR] Process failed to start: {self.process.errorString()}"
-            )
-            # Simulate finish with failure status
-            self.handle_process_finished(-1, QProcess.ExitStatus.CrashExit)
-            return
-
+    def handle_process_started(self):
         if self.log_files or self.log_directories:
             self._log_tail_timer.start()
 
     def read_realtime_output(self):
         if not self.process:
             return
-        try:
-            data = self.process.readAllStandardOutput().data()
-            # Try decoding UTF-8, fallback to latin-1 (common for console apps)
-            try:
-                output = data.decode("utf-8", errors="replace")
-            except UnicodeDecodeError:
-                output = data.decode("latin-1", errors="replace")
+        self._pending_output += self.process.readAllStandardOutput().data()
+        if not self._output_flush_timer.isActive():
+            self._output_flush_timer.start()
 
-            # Append to both internal buffer and UI display
-            if output:
-                self._log_buffer += output
-                self.append_log(output.rstrip())  # Avoid extra newlines in UI
+    def flush_process_output(self, final: bool = False):
+        self._output_flush_timer.stop()
+        data = bytes(self._pending_output)
+        self._pending_output.clear()
+        output = self._output_decoder.decode(data, final=final)
 
-        except Exception as e:
-            self.append_log(f"[Decode Error] Could not read process output: {e}")
+        # Append to both internal buffer and UI display
+        if output:
+            self._log_chunks.append(output)
+            self.append_log(output.rstrip())  # Avoid extra newlines in UI
 
     def append_log(self, text: str):
-        self.log_display.append(text)
+        cursor = self._log_cursor
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.log_display.document().isEmpty():
+            text = "\n" + text
+        cursor.insertText(text, self._log_char_format)
         scrollbar = self.log_display.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
@@ -233,7 +254,7 @@ class GenericUploadDialog(QDialog):
                     self.append_log(f"[Log file] {path}")
                     self._announced_log_files.add(path)
 
-                self._log_buffer += output
+                self._log_chunks.append(output)
                 self.append_log(output.rstrip())
 
             except OSError as e:
@@ -241,26 +262,45 @@ class GenericUploadDialog(QDialog):
 
     def cancel_process(self):
         if self.process and self.process.state() == QProcess.ProcessState.Running:
+            if self._cancelling:
+                return
+            self._cancelling = True
             self.append_log("-" * 20)
+            self.cancel_button.setEnabled(False)
             self.append_log("Attempting to cancel process...")
-            self.process.kill()
-            if not self.process.waitForFinished(2000):
-                self.append_log(
-                    "Warning: Process did not terminate quickly after kill signal."
-                )
-            else:
-                self.append_log("Process terminated by cancellation.")
-            # finished signal will be emitted
+            process = self.process
+            process.kill()
+            # handle_process_finished reports the exit once the OS has reaped
+            # the tool; the UI keeps running in the meantime.
+            QTimer.singleShot(
+                CANCEL_GRACE_MS, lambda: self._warn_if_still_running(process)
+            )
         else:
             self.reject()  # Close dialog if process not running
 
+    def _warn_if_still_running(self, process: QProcess):
+        if process is not self.process:
+            return
+        if process.state() != QProcess.ProcessState.NotRunning:
+            self.append_log(
+                "Warning: Process did not terminate quickly after kill signal."
+            )
+
     def handle_process_finished(self, exit_code: int, exit_status: QProcess.ExitStatus):
         if self.process is None:
             return
 
         self._log_tail_timer.stop()
+        if self.process.bytesAvailable():
+            self._pending_output += self.process.readAllStandardOutput().data()
+        self.flush_process_output(final=True)
         self.poll_tailed_logs()
 
+        # After the flush, so output produced before the kill is shown first.
+        if self._cancelling:
+            self._cancelling = False
+            self.append_log("Process terminated by cancellation.")
+
         status_str = (
             "Normal Exit"
             if exit_status == QProcess.ExitStatus.NormalExit
@@ -273,7 +313,9 @@ class GenericUploadDialog(QDialog):
 
         # --- Delegate Success Check ---
         try:
-            self.upload_successful = self.success_checker(exit_code, self._log_buffer)
+            self.upload_successful = self.success_checker(
+                exit_code, "".join(self._log_chunks)
+            )
             if self.upload_successful:
                 self.append_log("Operation reported as SUCCESSFUL.")
             else:
@@ -294,6 +336,16 @@ class GenericUploadDialog(QDialog):
     def handle_process_error(self, error: QProcess.ProcessError):
         if not self.process:
             return
+        if error == QProcess.ProcessError.FailedToStart:
+            self.append_log(
+                f"[ERROR] Process failed to start: {self.process.errorString()}"
+            )
+            # QProcess does not emit finished for a process that never started.
+            self.handle_process_finished(-1, QProcess.ExitStatus.CrashExit)
+            return
+        if self._cancelling and error == QProcess.ProcessError.Crashed:
+            # The kill from cancel_process; finished reports it.
+            return
         error_text = "Unknown QProcess error"
         self.append_log(f"[PROCESS ERROR] {error_text}")
 
@@ -306,6 +358,7 @@ class GenericUploadDialog(QDialog):
     def cleanup(self):
         logging.info(f"{self.__class__.__name__}: Running cleanup...")
         self._log_tail_timer.stop()
+        self._output_flush_timer.stop()
         if self.process and self.process.state() != QProcess.ProcessState.NotRunning:
             logging.info(f"{self.__class__.__name__}: Terminating running process...")
             # Disconnect signals first
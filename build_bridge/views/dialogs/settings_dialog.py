@@ -1,5 +1,5 @@
 import os, logging
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QEvent, pyqtSignal
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -17,8 +17,6 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QColor, QIcon
 
-from build_bridge.core.vcs.p4client import P4Client
-
 from build_bridge.database import SessionFactory
 from build_bridge.exceptions import InvalidConfigurationError
 from build_bridge.models import Project, PerforceConfig
@@ -103,13 +101,18 @@ class SettingsDialog(QDialog):
         # TODO: VCS
         # self.stack.addWidget(self.create_vcs_page())
 
+        # Store pages load their config (and keyring secrets) when built, so
+        # they start as placeholders and are built the first time they are shown.
         self.steam_config_widget = None
         self.itch_config_widget = None
+        self._page_factories = {}
         if not self.new_project:
-            self.steam_config_widget = SteamConfigWidget(self.session)
-            self.itch_config_widget = ItchConfigWidget(self.session)
-            self.stack.addWidget(self.steam_config_widget)
-            self.stack.addWidget(self.itch_config_widget)
+            self._page_factories = {
+                1: self.create_steam_page,
+                2: self.create_itch_page,
+            }
+            for _ in self._page_factories:
+                self.stack.addWidget(QWidget())
 
         layout.addWidget(self.stack, 3)
 
@@ -193,8 +196,12 @@ class SettingsDialog(QDialog):
         self.p4_user_input = QLineEdit(self.perforce_config.user or "")
         form_layout.addRow(QLabel("Perforce User:"), self.p4_user_input)
 
-        self.p4_password_input = QLineEdit(self.perforce_config.p4password or "")
+        # The stored password comes from the OS keyring, which can be slow, so it
+        # is only read once the field is focused or a connection test needs it.
+        self.p4_password_input = QLineEdit()
         self.p4_password_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self._p4_password_loaded = False
+        self.p4_password_input.installEventFilter(self)
         form_layout.addRow(QLabel("Perforce Password:"), self.p4_password_input)
 
         # Add note about keyring usage with better styling
@@ -231,8 +238,24 @@ class SettingsDialog(QDialog):
         page.setLayout(layout)
         return page
 
+    def eventFilter(self, watched, event):
+        if watched is self.p4_password_input and event.type() == QEvent.Type.FocusIn:
+            self._load_p4_password_once()
+        return super().eventFilter(watched, event)
+
+    def _load_p4_password_once(self):
+        if self._p4_password_loaded:
+            return
+        self._p4_password_loaded = True
+        self.p4_password_input.setText(self.perforce_config.p4password or "")
+
     def test_p4_connection(self):
         """Test the Perforce connection and display the result."""
+        # P4Python is only loaded once a connection test is actually run,
+        # not whenever the settings dialog module is imported.
+        from build_bridge.core.vcs.p4client import P4Client
+
+        self._load_p4_password_once()
         try:
             # Create a temporary Perforce client with the current settings
             temp_config = PerforceConfig(
@@ -265,10 +288,8 @@ class SettingsDialog(QDialog):
             return
 
         try:
-            if not self.new_project:
-                # Explicitly refresh from build_bridge.database to ensure we have latest data
-                self.session.refresh(self.project)
-
+            # The project was loaded by this dialog's own fresh session in
+            # load_project, so its fields are already current; no refresh needed.
             # Load data into form fields
             self.project_name_input.setText(self.project.name or "")
             self.source_dir_input.setText(self.project.source_dir or "")
@@ -281,7 +302,21 @@ class SettingsDialog(QDialog):
         except Exception as e:
             logging.info("Settings: Error loading form data: {str(e)}")
 
+    def create_steam_page(self):
+        self.steam_config_widget = SteamConfigWidget(self.session)
+        return self.steam_config_widget
+
+    def create_itch_page(self):
+        self.itch_config_widget = ItchConfigWidget(self.session)
+        return self.itch_config_widget
+
     def switch_page(self, index):
+        factory = self._page_factories.pop(index, None)
+        if factory is not None:
+            placeholder = self.stack.widget(index)
+            self.stack.insertWidget(index, factory())
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
         self.stack.setCurrentIndex(index)
         
     def apply_settings(self):
@@ -312,7 +347,9 @@ class SettingsDialog(QDialog):
             # This should be moved to self contained widget
             # try:
             #     self.perforce_config.user = self.p4_user_input.text().strip()
-            #     self.perforce_config.p4password = self.p4_password_input.text().strip()
+            #     # An unloaded field is empty, not cleared: keep the stored password.
+            #     if self._p4_password_loaded:
+            #         self.perforce_config.p4password = self.p4_password_input.text().strip()
             #     self.perforce_config.server_address = (
             #         self.p4_server_input.text().strip()
             #     )
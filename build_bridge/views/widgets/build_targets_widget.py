@@ -13,7 +13,7 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QDialog,
 )
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
 
 from build_bridge.core.builder.unreal_builder import (
@@ -35,6 +35,10 @@ from build_bridge.views.dialogs.build_dialog import BuildWindowDialog
 from build_bridge.views.dialogs.preflight_dialog import PreflightDialog
 from build_bridge.views.dialogs.build_target_setup_dialog import BuildTargetSetupDialog
 
+# Typing a version re-runs preflight (DB read plus filesystem checks), so it
+# waits for a pause in typing.
+PREFLIGHT_REFRESH_DELAY_MS = 300
+
 
 class BuildTargetRow(QWidget):
     """A single row representing one BuildTarget with its build controls."""
@@ -68,7 +72,11 @@ class BuildTargetRow(QWidget):
         self.build_version_input = QLineEdit("0.1")
         self.build_version_input.setFixedWidth(92)
         self.build_version_input.setToolTip("Version string for this build (e.g. 1.0, 0.2-beta)")
-        self.build_version_input.textChanged.connect(self._refresh_build_state)
+        self._preflight_refresh_timer = QTimer(self)
+        self._preflight_refresh_timer.setSingleShot(True)
+        self._preflight_refresh_timer.setInterval(PREFLIGHT_REFRESH_DELAY_MS)
+        self._preflight_refresh_timer.timeout.connect(self._refresh_build_state)
+        self.build_version_input.textChanged.connect(self._preflight_refresh_timer.start)
         row_layout.addWidget(self.build_version_input)
 
         self.edit_button = QPushButton("Edit")
@@ -109,6 +117,7 @@ class BuildTargetRow(QWidget):
         self._refresh_build_state()
 
     def _refresh_build_state(self):
+        self._preflight_refresh_timer.stop()
         release_name = self.build_version_input.text().strip()
 
         try:
@@ -143,10 +152,13 @@ class BuildTargetRow(QWidget):
         self.build_button.setEnabled(ready)
         self.build_button.setToolTip(tooltip)
         self.preflight_status_label.setText("●")
-        self.preflight_status_label.setProperty("ready", ready)
         self.preflight_status_label.setToolTip(tooltip)
-        self.preflight_status_label.style().unpolish(self.preflight_status_label)
-        self.preflight_status_label.style().polish(self.preflight_status_label)
+        # Re-polishing recomputes the label's style, so only do it when the
+        # [ready] selector actually flips.
+        if self.preflight_status_label.property("ready") != ready:
+            self.preflight_status_label.setProperty("ready", ready)
+            self.preflight_status_label.style().unpolish(self.preflight_status_label)
+            self.preflight_status_label.style().polish(self.preflight_status_label)
 
     def trigger_build(self):
         release_name = self.build_version_input.text().strip()
@@ -254,6 +266,7 @@ class BuildTargetRow(QWidget):
                         clean=False,
                         valve_package_pad=optimize_steam,
                         allow_existing_output_dir=overwrite_existing_build,
+                        uproject_path=preflight_result.uproject_path,
                     )
                 except ProjectFileNotFoundError as e:
                     QMessageBox.critical(self, "Project File Error", f"Project file not found: {str(e)}")
@@ -389,13 +402,13 @@ class BuildTargetListWidget(QWidget):
 
         try:
             with session_scope() as session:
-                targets = (
-                    session.query(BuildTarget)
+                # Each row loads its own target, so only the ids are needed here.
+                target_ids = [
+                    target_id
+                    for (target_id,) in session.query(BuildTarget.id)
                     .filter_by(project_id=self._project_id)
                     .order_by(BuildTarget.id.asc())
-                    .all()
-                )
-                target_ids = [t.id for t in targets]
+                ]
 
             if target_ids:
                 self.targets_container.setVisible(True)
@@ -236,8 +236,8 @@ class ItchConfigWidget(QWidget):
             # Update initial values
             self._initial_username = new_username
             self._initial_butler_path = new_butler_path
-            self.session.flush()
-            self._refresh_profile_combo(selected_id=self.itch_config.id)
+            # SettingsDialog commits every section in one go and closes, so
+            # there is nothing to flush or re-list here.
 
         except ValueError as e:
             logging.info(f"ItchConfigWidget: Error preparing settings for save: {e}")
@@ -9,6 +9,11 @@ from sqlalchemy.orm import Session
 from build_bridge.exceptions import InvalidConfigurationError
 from build_bridge.models import SteamConfig
 
+# Lowercased phrases in steamcmd output that decide the connection test result.
+# Chunks are stored newline-separated and no marker spans a newline, so scanning
+# each chunk on its own matches a search over the whole output.
+STEAM_TEST_OUTPUT_MARKERS = ("invalid password", "steam guard", "error!", "failed")
+
 class SteamConfigWidget(QWidget):
     """
     Manages Steam configurations (paths, username, password).
@@ -33,7 +38,10 @@ class SteamConfigWidget(QWidget):
 
         # --- QProcess ---
         self.process: QProcess | None = None
-        self._accumulated_output = ""
+        # Output is scanned for the result markers as it arrives, so finishing
+        # the test does not re-lowercase and re-search the whole log.
+        self._test_output_chunks: list[str] = []
+        self._test_output_markers: set[str] = set()
 
         # --- UI Elements ---
         self.profile_combo = QComboBox()
@@ -222,8 +230,10 @@ class SteamConfigWidget(QWidget):
             # Update initial values to reflect saved state
             self._initial_username = new_username
             self._initial_steamcmd_path = new_steamcmd_path
+            # Flushed so a new config has its id: store_password keys the
+            # keyring entry on it. SettingsDialog closes after saving, so the
+            # profile combo is not re-listed.
             self.session.flush()
-            self._refresh_profile_combo(selected_id=self.steam_config.id)
 
         except ValueError as e:
             logging.info(f"SteamConfigWidget: Error preparing settings for save: {e}")
@@ -299,7 +309,9 @@ class SteamConfigWidget(QWidget):
         self.status_label.setStyleSheet("color: orange; font-style: normal;")
         QApplication.processEvents() # Ensure UI updates immediately
 
-        self._accumulated_output = "" # Reset output for this run
+        # Reset output for this run
+        self._test_output_chunks = []
+        self._test_output_markers = set()
 
         self.process = QProcess(self)
         self.process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
@@ -329,7 +341,11 @@ class SteamConfigWidget(QWidget):
             output_string = output_bytes.data().decode(errors='ignore').strip()
             if output_string:
                 logging.info(f"SteamCMD Test Output: {output_string}")
-                self._accumulated_output += output_string + "\n"
+                self._test_output_chunks.append(output_string)
+                lowered = output_string.lower()
+                self._test_output_markers.update(
+                    marker for marker in STEAM_TEST_OUTPUT_MARKERS if marker in lowered
+                )
         except Exception as e:
             logging.info(f"Error reading test process output: {e}")
 
@@ -352,27 +368,28 @@ class SteamConfigWidget(QWidget):
 
         success = False
         message = ""
-        full_output = self._accumulated_output.lower()
+        markers = self._test_output_markers
+        details = "\n".join(self._test_output_chunks)
 
         if exit_status == QProcess.ExitStatus.CrashExit:
             message = "SteamCMD process crashed during test."
         elif exit_code != 0:
             message = f"SteamCMD exited with error code {exit_code}."
             # Check common failure reasons in output
-            if "invalid password" in full_output:
+            if "invalid password" in markers:
                  message = "Connection failed: Invalid password."
-            elif "steam guard" in full_output:
+            elif "steam guard" in markers:
                  message = "Connection failed: Steam Guard code required (not supported)."
-            elif self._accumulated_output:
-                 message += f"\nDetails:\n{self._accumulated_output.strip()}"
-        elif "error!" in full_output or "failed" in full_output:
+            elif details:
+                 message += f"\nDetails:\n{details.strip()}"
+        elif "error!" in markers or "failed" in markers:
              message = "SteamCMD reported errors during test."
-             if "invalid password" in full_output:
+             if "invalid password" in markers:
                   message = "Connection failed: Invalid password reported."
-             elif "steam guard" in full_output:
+             elif "steam guard" in markers:
                   message = "Connection failed: Steam Guard code required (not supported)."
              else:
-                  message += f"\nDetails:\n{self._accumulated_output.strip()}"
+                  message += f"\nDetails:\n{details.strip()}"
         else:
              # Exit code 0, normal exit, no obvious errors detected
              # Treat this as a successful connection test for the purpose of the UI
@@ -15,7 +15,6 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import pyqtSignal
 from sqlalchemy.orm import object_session
 
-from build_bridge.database import session_scope
 from build_bridge.exceptions import InvalidConfigurationError
 from build_bridge.core.publisher.itch.itch_publisher import (
     validate_itch_channel,
@@ -29,11 +28,11 @@ class ItchPublishProfileWidget(QWidget):
     profile_saved_signal = pyqtSignal()
 
     def __init__(self, publish_profile: ItchPublishProfile, session, parent=None):
+        super().__init__(parent=parent)
+
         self.publish_profile = publish_profile
         self.session = session
 
-        super().__init__(parent=parent)
-
         self._init_ui()
         self._populate_fields()
 
@@ -116,31 +115,35 @@ class ItchPublishProfileWidget(QWidget):
         self.auth_combo.clear()
         current_itch_config_id = getattr(self.publish_profile, "itch_config_id", None)
 
-        with session_scope() as session:
-            itch_configs = (
-                session.query(ItchConfig).order_by(ItchConfig.username.asc()).all()
-            )
-
-            try:
-                if not itch_configs:
-                    self.auth_combo.addItem("No Itch.io accounts configured", None)
-                    self.auth_combo.setEnabled(False)
-                else:
-                    self.auth_combo.setEnabled(True)
-                    self.auth_combo.addItem("Select Auth Profile...", None)
-                    for itch_config in itch_configs:
-                        self.auth_combo.addItem(itch_config.username, itch_config.id)
-
-                if current_itch_config_id is not None:
-                    selected_index = self.auth_combo.findData(current_itch_config_id)
-                    self.auth_combo.setCurrentIndex(selected_index if selected_index >= 0 else 0)
-                else:
-                    self.auth_combo.setCurrentIndex(1 if len(itch_configs) == 1 else 0)
-
-            except Exception as e:
-                QMessageBox.critical(self, "Database Error",
-                                      f"Failed to load Itch.io authentications: {e}")
+        # Runs again after SettingsDialog commits from its own session, so rows
+        # already in this session's identity map are refreshed from the database.
+        itch_configs = (
+            self.session.query(ItchConfig)
+            .execution_options(populate_existing=True)
+            .order_by(ItchConfig.username.asc())
+            .all()
+        )
+
+        try:
+            if not itch_configs:
+                self.auth_combo.addItem("No Itch.io accounts configured", None)
                 self.auth_combo.setEnabled(False)
+            else:
+                self.auth_combo.setEnabled(True)
+                self.auth_combo.addItem("Select Auth Profile...", None)
+                for itch_config in itch_configs:
+                    self.auth_combo.addItem(itch_config.username, itch_config.id)
+
+            if current_itch_config_id is not None:
+                selected_index = self.auth_combo.findData(current_itch_config_id)
+                self.auth_combo.setCurrentIndex(selected_index if selected_index >= 0 else 0)
+            else:
+                self.auth_combo.setCurrentIndex(1 if len(itch_configs) == 1 else 0)
+
+        except Exception as e:
+            QMessageBox.critical(self, "Database Error",
+                                  f"Failed to load Itch.io authentications: {e}")
+            self.auth_combo.setEnabled(False)
 
     def save_profile(self):
         if not self.publish_profile:
@@ -175,15 +178,16 @@ class ItchPublishProfileWidget(QWidget):
             self.publish_profile.itch_config_id = selected_auth_id
 
             self.session.commit()
-            self.profile_saved_signal.emit()
-            QMessageBox.information(self, "Success", "Itch.io publishing configuration saved.")
-            return True
 
         except Exception as e:
             self.session.rollback()
             QMessageBox.critical(self, "Save Error", f"An error occurred while saving:\n{e}")
             return False
 
+        QMessageBox.information(self, "Success", "Itch.io publishing configuration saved.")
+        self.profile_saved_signal.emit()
+        return True
+
     def _default_description(self):
         target = self.publish_profile.build_target
         if target and target.name:
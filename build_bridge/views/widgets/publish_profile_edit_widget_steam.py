@@ -1,6 +1,5 @@
 import copy
 import logging
-import os
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
@@ -15,19 +14,143 @@ from PyQt6.QtWidgets import (
     QFileDialog,
     QComboBox,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QAbstractItemView,
     QHeaderView,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyle,
+    QApplication,
 )
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QAbstractTableModel, QEvent, QModelIndex, Qt, pyqtSignal
 from sqlalchemy.orm import object_session
 
 from build_bridge.models import SteamConfig, SteamPublishProfile
+from build_bridge.utils.paths import existing_paths
 from build_bridge.views.dialogs import settings_dialog
 
 
+class DepotMappingModel(QAbstractTableModel):
+    """Depot rows kept as plain ``[depot_id, path]`` string pairs.
+
+    The third column only exists for the browse button delegate and holds no data.
+    """
+
+    HEADERS = ("Depot ID", "Path (Directory)", "Browse")
+    ID_COLUMN, PATH_COLUMN, BROWSE_COLUMN = range(3)
+
+    def __init__(self, depots: dict | None = None, parent=None):
+        super().__init__(parent)
+        self._rows: list[list[str]] = []
+        if depots:
+            self.set_depots(depots)
+
+    def set_depots(self, depots: dict):
+        self.beginResetModel()
+        self._rows = [
+            [str(depot_id) if depot_id is not None else "", depot_path or ""]
+            for depot_id, depot_path in depots.items()
+        ]
+        self.endResetModel()
+
+    def rows(self) -> list[tuple[str, str]]:
+        return [(depot_id, depot_path) for depot_id, depot_path in self._rows]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.column() == self.BROWSE_COLUMN:
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if (
+            not index.isValid()
+            or index.column() == self.BROWSE_COLUMN
+            or role != Qt.ItemDataRole.EditRole
+        ):
+            return False
+        self._rows[index.row()][index.column()] = str(value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() != self.BROWSE_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count <= 0:
+            return False
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._rows[row:row] = [["", ""] for _ in range(count)]
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count <= 0 or row + count > len(self._rows):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        self.endRemoveRows()
+        return True
+
+
+class _BrowseButtonDelegate(QStyledItemDelegate):
+    """Paints a "Browse..." button in every row of a column and reports clicks,
+    so the table does not need a real button widget per row."""
+
+    browse_requested = pyqtSignal(int)
+
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect
+        button.text = "Browse..."
+        button.state = option.state | QStyle.StateFlag.State_Enabled
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+
+    def sizeHint(self, option, index):
+        button = QStyleOptionButton()
+        button.text = "Browse..."
+        style = option.widget.style() if option.widget else QApplication.style()
+        text_size = option.fontMetrics.size(0, button.text)
+        return style.sizeFromContents(
+            QStyle.ContentsType.CT_PushButton, button, text_size, option.widget
+        )
+
+    def createEditor(self, parent, option, index):
+        return None
+
+    def editorEvent(self, event, model, option, index):
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+            and option.rect.contains(event.position().toPoint())
+        ):
+            self.browse_requested.emit(index.row())
+            return True
+        return False
+
+
 class SteamPublishProfileWidget(QWidget):
     profile_saved_signal = pyqtSignal()
 
@@ -127,14 +250,22 @@ class SteamPublishProfileWidget(QWidget):
             self.auth_combo.setEnabled(False)
 
     def _create_depots_table(self):
-        table = QTableWidget(0, 3)
-        table.setHorizontalHeaderLabels(["Depot ID", "Path (Directory)", "Browse"])
+        # The rows live in a plain Python list behind the model, so no per-cell
+        # item objects are created and saving reads the strings directly.
+        table = QTableView()
+        table.setModel(DepotMappingModel(parent=table))
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         table.horizontalHeader().setStretchLastSection(False)
         table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        # The row is resolved at click time, so it stays right after rows are removed.
+        browse_delegate = _BrowseButtonDelegate(table)
+        browse_delegate.browse_requested.connect(
+            lambda row, tbl=table: self._browse_depot_path(tbl, row)
+        )
+        table.setItemDelegateForColumn(DepotMappingModel.BROWSE_COLUMN, browse_delegate)
         return table
 
     def _create_depot_buttons(self, target_table):
@@ -148,103 +279,91 @@ class SteamPublishProfileWidget(QWidget):
         layout.addStretch()
         return layout
 
-    def _load_depots_table(self, table_widget: QTableWidget, depots_dict: dict):
-        table_widget.setRowCount(0)
+    def _load_depots_table(self, table_view: QTableView, depots_dict: dict):
+        model = table_view.model()
         if not isinstance(depots_dict, dict):
             logging.info(f"Warning: Depots data is not a dictionary: {depots_dict}")
+            model.set_depots({})
             return
-        for depot_id, depot_path in depots_dict.items():
-            self._insert_depot_row(table_widget, depot_id, depot_path)
-
-    def _insert_depot_row(self, table_widget: QTableWidget, depot_id=None, depot_path=None):
-        row = table_widget.rowCount()
-        table_widget.insertRow(row)
-
-        id_item = QTableWidgetItem(str(depot_id) if depot_id is not None else "")
-        table_widget.setItem(row, 0, id_item)
+        # A single model reset, so the view lays out once for all rows.
+        model.set_depots(depots_dict)
 
-        path_item = QTableWidgetItem(depot_path or "")
-        table_widget.setItem(row, 1, path_item)
-
-        browse_button = QPushButton("Browse...")
-        browse_button.clicked.connect(
-            lambda checked=False, tbl=table_widget, r=row: self._browse_depot_path(tbl, r)
-        )
-        table_widget.setCellWidget(row, 2, browse_button)
-
-    def _add_depot_row(self, table_widget: QTableWidget):
-        self._insert_depot_row(table_widget)
-        table_widget.scrollToBottom()
+    def _add_depot_row(self, table_view: QTableView):
+        model = table_view.model()
+        model.insertRows(model.rowCount(), 1)
+        table_view.scrollToBottom()
 
     def _remove_depot_row(self):
-        current_row = self.depots_table.currentRow()
+        current_row = self.depots_table.currentIndex().row()
         if current_row >= 0:
-            self.depots_table.removeRow(current_row)
+            self.depots_table.model().removeRows(current_row, 1)
         else:
             QMessageBox.warning(self, "No Selection", "Please select a depot row to remove.")
 
-    def _browse_depot_path(self, table_widget: QTableWidget, row):
-        current_path_item = table_widget.item(row, 1)
-        start_dir = ""
-        if current_path_item and current_path_item.text():
-            start_dir = current_path_item.text()
-        elif self.publish_profile.build_target and self.publish_profile.build_target.builds_path:
+    def _browse_depot_path(self, table_view: QTableView, row):
+        model = table_view.model()
+        path_index = model.index(row, DepotMappingModel.PATH_COLUMN)
+        start_dir = model.data(path_index) or ""
+        if not start_dir and self.publish_profile.build_target and self.publish_profile.build_target.builds_path:
             start_dir = str(self.publish_profile.build_target.builds_path)
 
         path = QFileDialog.getExistingDirectory(self, "Select Depot Directory", start_dir)
         if path:
-            table_widget.setItem(row, 1, QTableWidgetItem(path))
+            model.setData(path_index, path)
 
     def _open_steam_settings(self):
         settings = settings_dialog.SettingsDialog(default_page=1)
         settings.exec()
         self._refresh_auth_options()
 
-    def _collect_and_validate_depots(self, table_widget: QTableWidget):
-        depots_to_save = {}
-        for row in range(table_widget.rowCount()):
-            id_item = table_widget.item(row, 0)
-            path_item = table_widget.item(row, 1)
-
-            if not id_item or not id_item.text().strip():
-                QMessageBox.warning(self, "Validation Error", f"Depot ID is missing in row {row+1}.")
-                table_widget.selectRow(row)
-                table_widget.setFocus()
-                return None
-            if not path_item or not path_item.text().strip():
-                QMessageBox.warning(self, "Validation Error", f"Depot Path is missing in row {row+1}.")
-                table_widget.selectRow(row)
-                table_widget.setFocus()
-                return None
+    def _collect_and_validate_depots(self, table_view: QTableView):
+        validated_rows: list[tuple[int, int, str]] = []
+        seen_ids: set[int] = set()
+        errors: list[tuple[int, str]] = []
+        for row, (id_text, depot_path) in enumerate(table_view.model().rows()):
+            id_text = id_text.strip()
+            depot_path = depot_path.strip()
+
+            if not id_text:
+                errors.append((row, "Depot ID is missing."))
+                continue
+            if not depot_path:
+                errors.append((row, "Depot Path is missing."))
+                continue
 
             try:
-                depot_id = int(id_item.text().strip())
+                depot_id = int(id_text)
                 if depot_id <= 0:
                     raise ValueError("Depot ID must be positive")
             except ValueError:
-                QMessageBox.warning(self, "Validation Error",
-                                     f"Invalid Depot ID '{id_item.text()}' in row {row+1}. Must be a positive integer.")
-                table_widget.selectRow(row)
-                table_widget.editItem(id_item)
-                return None
-
-            depot_path = path_item.text().strip()
-            if not os.path.exists(depot_path):
-                QMessageBox.warning(self, "Validation Error",
-                                     f"Depot path in row {row+1} does not exist:\n{depot_path}")
-                table_widget.selectRow(row)
-                table_widget.setFocus()
-                return None
-
-            if depot_id in depots_to_save:
-                QMessageBox.warning(self, "Validation Error",
-                                     f"Duplicate Depot ID '{depot_id}' found in row {row+1}.")
-                table_widget.selectRow(row)
-                table_widget.editItem(id_item)
-                return None
-
-            depots_to_save[depot_id] = depot_path
-        return depots_to_save
+                errors.append(
+                    (row, f"Invalid Depot ID '{id_text}'. Must be a positive integer.")
+                )
+                continue
+
+            if depot_id in seen_ids:
+                errors.append((row, f"Duplicate Depot ID '{depot_id}'."))
+                continue
+
+            seen_ids.add(depot_id)
+            validated_rows.append((row, depot_id, depot_path))
+
+        present = existing_paths(depot_path for _, _, depot_path in validated_rows)
+        for row, _, depot_path in validated_rows:
+            if depot_path not in present:
+                errors.append((row, f"Depot path does not exist:\n{depot_path}"))
+        errors.sort(key=lambda error: error[0])
+
+        if errors:
+            table_view.selectRow(errors[0][0])
+            table_view.setFocus()
+            QMessageBox.warning(
+                self,
+                "Validation Error",
+                "\n".join(f"Row {row + 1}: {message}" for row, message in errors),
+            )
+            return None
+        return {depot_id: depot_path for _, depot_id, depot_path in validated_rows}
 
     def save_profile(self):
         if not self.publish_profile:
@@ -268,18 +387,18 @@ class SteamPublishProfileWidget(QWidget):
             return False
 
         try:
+            # Resolved before any assignment: it can lazy-load the target or
+            # project, and that autoflush must not push half the changes.
+            description = self._default_description()
             if not object_session(self.publish_profile):
                 self.session.add(self.publish_profile)
 
             self.publish_profile.steam_config_id = selected_auth_id
             self.publish_profile.app_id = app_id
-            self.publish_profile.description = self._default_description()
+            self.publish_profile.description = description
             self.publish_profile.depots = regular_depots
 
             self.session.commit()
-            self.profile_saved_signal.emit()
-            QMessageBox.information(self, "Success", "Steam publishing configuration saved.")
-            return True
 
         except AttributeError as e:
             self.session.rollback()
@@ -290,6 +409,12 @@ class SteamPublishProfileWidget(QWidget):
             QMessageBox.critical(self, "Save Error", f"An error occurred while saving:\n{e}")
             return False
 
+        # Outside the try: the save is final here, so a failing slot must not
+        # trigger a rollback or be reported as a save error.
+        QMessageBox.information(self, "Success", "Steam publishing configuration saved.")
+        self.profile_saved_signal.emit()
+        return True
+
     def _default_description(self):
         target = self.publish_profile.build_target
         if target and target.name:
@@ -16,9 +16,9 @@ from PyQt6.QtWidgets import (
     QDialog,
     QStyle,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
 from PyQt6.QtGui import QFont
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from build_bridge.models import (
     Build,
@@ -30,7 +30,12 @@ from build_bridge.models import (
     SteamPublishProfile,
     StoreEnum,
 )
-from build_bridge.core.builds import BuildDeletionError, delete_build
+from build_bridge.core.builds import (
+    BuildDeletionError,
+    delete_build,
+    has_windows_executable,
+    scan_build_folders,
+)
 from build_bridge.core.publisher.itch.itch_publisher import ItchPublisher
 from build_bridge.core.preflight import validate_publish_preflight
 from build_bridge.database import SessionFactory
@@ -40,11 +45,44 @@ from build_bridge.views.dialogs.preflight_dialog import PreflightDialog
 from build_bridge.views.dialogs.publish_profile_dialog import PublishProfileDialog
 
 
+class _BuildFolderScanSignals(QObject):
+    finished = pyqtSignal(int, list)
+    missing = pyqtSignal(int, str)
+    failed = pyqtSignal(int, str)
+
+
+class _BuildFolderScanTask(QRunnable):
+    """Enumerates build folders on a pool thread; results are delivered via signals."""
+
+    def __init__(self, generation: int, scan_root: str, skip_names: set[str]):
+        super().__init__()
+        self.generation = generation
+        self.scan_root = scan_root
+        self.skip_names = skip_names
+        self.signals = _BuildFolderScanSignals()
+
+    def run(self):
+        try:
+            folders = scan_build_folders(self.scan_root, self.skip_names)
+        except (FileNotFoundError, NotADirectoryError):
+            self.signals.missing.emit(self.generation, self.scan_root)
+            return
+        except OSError as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        self.signals.finished.emit(self.generation, folders)
+
+
 class PublishProfileListWidget(QWidget):
     def __init__(self, project_id: int | None = None):
         super().__init__()
         self.session = SessionFactory()
         self._project_id = project_id
+        # Bumped whenever a scan starts or the project changes so late results
+        # from a previous scan are dropped instead of imported into the wrong project.
+        self._scan_generation = 0
+        self._scan_task: _BuildFolderScanTask | None = None
+        self._import_target_id: int | None = None
 
         self.setWindowTitle("Available Builds")
         self.setGeometry(100, 100, 600, 400)
@@ -107,6 +145,9 @@ class PublishProfileListWidget(QWidget):
 
     def set_project_id(self, project_id: int | None):
         self._project_id = project_id
+        self._scan_generation += 1
+        self._scan_task = None
+        self.import_button.setEnabled(True)
         self.refresh_builds()
 
     def _get_project(self):
@@ -195,30 +236,42 @@ class PublishProfileListWidget(QWidget):
         # Scan archive_dir/project_name/ — subdirs that are NOT target names are
         # old-style version folders (pre-refactor builds).
         scan_root = Path(project.archive_directory) / project.name
-        if not scan_root.exists():
-            QMessageBox.information(self, "Import", f"Directory not found:\n{scan_root}")
+
+        self._scan_generation += 1
+        self._import_target_id = targets[0].id
+        task = _BuildFolderScanTask(
+            generation=self._scan_generation,
+            scan_root=str(scan_root),
+            skip_names={t.name for t in targets if t.name},
+        )
+        task.signals.finished.connect(self._on_import_scan_finished)
+        task.signals.missing.connect(self._on_import_scan_missing)
+        task.signals.failed.connect(self._on_import_scan_failed)
+        self._scan_task = task
+        self.import_button.setEnabled(False)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_import_scan_finished(self, generation: int, folders: list):
+        if generation != self._scan_generation:
             return
+        self._scan_task = None
+        self.import_button.setEnabled(True)
 
-        target_names = {t.name for t in targets if t.name}
         existing_paths = {b.output_path for b in self.session.query(Build.output_path).all()}
 
         imported = 0
-        for entry in sorted(scan_root.iterdir()):
-            if not entry.is_dir() or entry.name in target_names:
-                continue
-            version = entry.name
-            output_path = str(entry)
+        for version, output_path, mtime in folders:
             if output_path in existing_paths:
                 continue
 
             # Assign to the first (or only) build target; ambiguity is rare in
             # the single-project model this app uses.
             build = Build(
-                build_target_id=targets[0].id,
+                build_target_id=self._import_target_id,
                 version=version,
                 output_path=output_path,
                 status=BuildStatusEnum.success,
-                created_at=datetime.fromtimestamp(entry.stat().st_mtime),
+                created_at=datetime.fromtimestamp(mtime),
             )
             self.session.add(build)
             imported += 1
@@ -231,6 +284,21 @@ class PublishProfileListWidget(QWidget):
         else:
             QMessageBox.information(self, "Import", "No new builds found to import.")
 
+    def _on_import_scan_missing(self, generation: int, scan_root: str):
+        if generation != self._scan_generation:
+            return
+        self._scan_task = None
+        self.import_button.setEnabled(True)
+        QMessageBox.information(self, "Import", f"Directory not found:\n{scan_root}")
+
+    def _on_import_scan_failed(self, generation: int, error: str):
+        if generation != self._scan_generation:
+            return
+        self._scan_task = None
+        self.import_button.setEnabled(True)
+        logging.info(f"Error scanning for builds to import: {error}")
+        QMessageBox.warning(self, "Import", f"Could not scan for builds:\n{error}")
+
     def closeEvent(self, a0):
         self.session.close()
         return super().closeEvent(a0)
@@ -269,6 +337,9 @@ class BuildTargetBuildGroup(QWidget):
         builds_layout.setContentsMargins(10, 0, 0, 0)
         builds_layout.setSpacing(0)
 
+        # Every build in the group shares the target's publish profiles, so the
+        # rows share one lookup cache instead of each querying the same rows.
+        profile_cache: dict[StoreEnum, PublishProfile | None] = {}
         for build in builds:
             builds_layout.addWidget(
                 PublishProfileEntry(
@@ -276,6 +347,7 @@ class BuildTargetBuildGroup(QWidget):
                     session=session,
                     show_target_name=False,
                     on_build_removed=on_build_removed,
+                    profile_cache=profile_cache,
                 )
             )
 
@@ -288,15 +360,37 @@ class PublishProfileEntry(QWidget):
         StoreEnum.itch: ItchPublishProfile,
         StoreEnum.steam: SteamPublishProfile,
     }
+    # Publishing reads the store credentials straight after the profile, so
+    # they are joined into the same SELECT instead of lazy-loaded.
+    profile_config_relationships = {
+        StoreEnum.itch: ItchPublishProfile.itch_config,
+        StoreEnum.steam: SteamPublishProfile.steam_config,
+    }
 
-    def __init__(self, build: Build, session, show_target_name: bool = True, on_build_removed=None):
+    def __init__(
+        self,
+        build: Build,
+        session,
+        show_target_name: bool = True,
+        on_build_removed=None,
+        profile_cache: dict | None = None,
+    ):
         super().__init__()
         self.build = build
         self.build_root = build.output_path
         self.build_id = build.version  # kept for compatibility with existing label references
         self.publish_profile: PublishProfile | None = None
+        # Profiles already looked up for this build's target, per store. Switching
+        # the store combo back and forth reuses them instead of querying again;
+        # rows of the same target may pass in a shared dict.
+        self._profiles_by_store: dict[StoreEnum, PublishProfile | None] = (
+            profile_cache if profile_cache is not None else {}
+        )
         self.session = session
         self.on_build_removed = on_build_removed
+        # Non-modal upload started from this row; Publish stays disabled until it
+        # finishes so a second upload cannot rewrite the same VDF and logs.
+        self._upload_dialog: QDialog | None = None
 
         self.setObjectName("buildRow")
         self.main_layout = QHBoxLayout(self)
@@ -377,15 +471,24 @@ class PublishProfileEntry(QWidget):
         self.on_store_changed()
 
     def update_publish_button_enabled(self):
-        ready = self.store_type_combo.currentData() is not None and self.publish_profile is not None
+        ready = (
+            self.store_type_combo.currentData() is not None
+            and self.publish_profile is not None
+            and self._upload_dialog is None
+        )
         self.publish_button.setEnabled(ready)
         self._refresh_publish_tooltip()
 
+    def _on_upload_finished(self, _result: int):
+        self._upload_dialog = None
+        self.update_publish_button_enabled()
+
     def on_store_changed(self):
         self._load_default_publish_profile()
         self.update_publish_button_enabled()
 
     def on_publish_profile_added_or_updated(self):
+        self._profiles_by_store.clear()
         self._load_default_publish_profile()
         self.update_publish_button_enabled()
 
@@ -401,17 +504,19 @@ class PublishProfileEntry(QWidget):
             return
 
         try:
-            self.session.refresh(self.build)
-            profile_model = self.profile_models[selected_store_enum]
-            self.publish_profile = (
-                self.session.query(profile_model)
-                .filter_by(
-                    build_target_id=self.build.build_target_id,
-                    store_type=selected_store_enum,
+            if selected_store_enum not in self._profiles_by_store:
+                profile_model = self.profile_models[selected_store_enum]
+                self._profiles_by_store[selected_store_enum] = (
+                    self.session.query(profile_model)
+                    .options(joinedload(self.profile_config_relationships[selected_store_enum]))
+                    .filter_by(
+                        build_target_id=self.build.build_target_id,
+                        store_type=selected_store_enum,
+                    )
+                    .order_by(PublishProfile.id.asc())
+                    .first()
                 )
-                .order_by(PublishProfile.id.asc())
-                .first()
-            )
+            self.publish_profile = self._profiles_by_store[selected_store_enum]
         except Exception as e:
             logging.info(f"Error loading publishing configuration: {e}")
             self.publish_profile = None
@@ -452,6 +557,7 @@ class PublishProfileEntry(QWidget):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.publish_profile = dialog.publish_profile
 
+        self._profiles_by_store.pop(selected_platform_enum, None)
         self._load_default_publish_profile()
         self.update_publish_button_enabled()
 
@@ -459,6 +565,7 @@ class PublishProfileEntry(QWidget):
         profile_model = self.profile_models[store_type]
         profile = (
             self.session.query(profile_model)
+            .options(joinedload(self.profile_config_relationships[store_type]))
             .filter_by(build_target_id=self.build.build_target_id, store_type=store_type)
             .order_by(PublishProfile.id.asc())
             .first()
@@ -490,11 +597,7 @@ class PublishProfileEntry(QWidget):
                     f"No publisher implementation found for {selected_platform_enum.value}"
                 )
 
-            if selected_platform_enum == StoreEnum.steam:
-                publisher_instance = publisher_class(publish_profile=self.publish_profile)
-            else:
-                publisher_instance = publisher_class(publish_profile=self.publish_profile)
-
+            publisher_instance = publisher_class(publish_profile=self.publish_profile)
             publisher_instance.validate_publish_profile()
             self.publish_button.setToolTip(
                 f"Publish build '{self.build_id}' to {selected_platform_enum.value}"
@@ -511,35 +614,15 @@ class PublishProfileEntry(QWidget):
             raise InvalidConfigurationError("Build directory path is invalid.")
 
         try:
-            has_exe_in_root = any(
-                f.lower().endswith(".exe")
-                for f in os.listdir(self.build_root)
-                if os.path.isfile(os.path.join(self.build_root, f))
-            )
-
-            first_subfolder_path = None
-            for item in os.listdir(self.build_root):
-                full_item_path = os.path.join(self.build_root, item)
-                if os.path.isdir(full_item_path):
-                    first_subfolder_path = full_item_path
-                    break
-
-            has_exe_in_subfolder = False
-            if first_subfolder_path:
-                has_exe_in_subfolder = any(
-                    f.lower().endswith(".exe")
-                    for f in os.listdir(first_subfolder_path)
-                    if os.path.isfile(os.path.join(first_subfolder_path, f))
-                )
-
-            if not has_exe_in_root and not has_exe_in_subfolder:
-                raise InvalidConfigurationError(
-                    "Build folder or its first subfolder does not contain an executable (.exe)."
-                )
-
+            has_exe = has_windows_executable(self.build_root)
         except OSError as e:
             raise InvalidConfigurationError(f"Error accessing build directory content: {e}")
 
+        if not has_exe:
+            raise InvalidConfigurationError(
+                "Build folder or its first subfolder does not contain an executable (.exe)."
+            )
+
     def browse_archive_directory(self):
         if self.build_root and os.path.isdir(self.build_root):
             try:
@@ -616,6 +699,8 @@ class PublishProfileEntry(QWidget):
         return bool(disk_checkbox and disk_checkbox.isChecked())
 
     def handle_publish(self):
+        if self._upload_dialog is not None:
+            return
         selected_store_enum = self.store_type_combo.currentData()
         if selected_store_enum is None:
             QMessageBox.warning(self, "Error", "No target platform selected.")
@@ -634,12 +719,10 @@ class PublishProfileEntry(QWidget):
         try:
             self.validate_build_content()
 
-            if selected_store_enum == StoreEnum.steam:
-                publisher_instance = publisher_class(self.publish_profile)
-                logging.info(f"Attempting to publish build '{self.build_id}' to Steam...")
-            else:
-                publisher_instance = publisher_class(self.publish_profile)
-                logging.info(f"Attempting to publish build '{self.build_id}' to {selected_store_enum}...")
+            publisher_instance = publisher_class(self.publish_profile)
+            logging.info(
+                f"Attempting to publish build '{self.build_id}' to {selected_store_enum.value}..."
+            )
 
             publisher_instance.validate_publish_profile()
 
@@ -652,7 +735,15 @@ class PublishProfileEntry(QWidget):
             if preflight_dialog.exec() != QDialog.DialogCode.Accepted:
                 return
 
-            publisher_instance.publish(content_dir=self.build_root, version=self.build.version)
+            upload_dialog = publisher_instance.publish(
+                content_dir=self.build_root,
+                version=self.build.version,
+                parent=self.window(),
+            )
+            if upload_dialog is not None and upload_dialog.isVisible():
+                self._upload_dialog = upload_dialog
+                upload_dialog.finished.connect(self._on_upload_finished)
+                self.update_publish_button_enabled()
 
         except InvalidConfigurationError as e:
             QMessageBox.warning(self, "Publishing Error",